@@ -382,7 +382,7 @@ impl From<&CanonicalHand> for CanonicalHandOutput {
 /// Get all 169 canonical starting hands
 #[tauri::command]
 pub fn get_canonical_hands() -> Vec<CanonicalHandOutput> {
-    canonize::get_all_canonical_hands()
+    canonize::CanonicalHand::all()
         .iter()
         .map(CanonicalHandOutput::from)
         .collect()
@@ -442,9 +442,9 @@ impl From<Card> for CardInfoOutput {
     fn from(card: Card) -> Self {
         Self {
             notation: card.to_string(),
-            rank: card.rank.to_char().to_string(),
-            suit: card.suit.to_char().to_string(),
-            suit_symbol: suit_symbol(card.suit),
+            rank: card.rank().to_char().to_string(),
+            suit: card.suit().to_char().to_string(),
+            suit_symbol: suit_symbol(card.suit()),
         }
     }
 }
@@ -0,0 +1,67 @@
+//! Benchmarks for the hot paths: hand evaluation, draw analysis, card
+//! parsing, dealing and Monte Carlo equity.
+//!
+//! Run with `cargo bench`.
+
+use criterion::{black_box, criterion_group, criterion_main, Criterion};
+use holdem_core::card::parse_cards;
+use holdem_core::{
+    analyze_draws, calculate_equity, evaluate_hand_strength, find_winners_batch, Card, Deck,
+    EquityRequest, PlayerHand,
+};
+
+fn cards(s: &str) -> Vec<Card> {
+    parse_cards(s).unwrap()
+}
+
+fn bench_evaluator(c: &mut Criterion) {
+    let seven = cards("Ah Kh Qh Jh 2c 3d 9s");
+    c.bench_function("evaluate_hand_strength/7", |b| {
+        b.iter(|| evaluate_hand_strength(black_box(&seven)));
+    });
+
+    let hands: Vec<[Card; 7]> = ["Ah Kd 7c 7d 2s 9h Th", "Qs Qc 7c 7d 2s 9h Th"]
+        .iter()
+        .map(|s| cards(s).try_into().unwrap())
+        .collect();
+    c.bench_function("find_winners_batch/2", |b| {
+        b.iter(|| find_winners_batch(black_box(&hands)));
+    });
+}
+
+fn bench_draws(c: &mut Criterion) {
+    let hole = cards("Ah Th");
+    let board = cards("9h 8c 2h");
+    c.bench_function("analyze_draws/flop", |b| {
+        b.iter(|| analyze_draws(black_box(&hole), black_box(&board), &[]));
+    });
+}
+
+fn bench_cards(c: &mut Criterion) {
+    c.bench_function("parse_cards/7", |b| {
+        b.iter(|| parse_cards(black_box("Ah Kh Qh Jh 2c 3d 9s")));
+    });
+
+    let mut deck = Deck::new(Some(42));
+    c.bench_function("deck/reset_deal_9", |b| {
+        b.iter(|| {
+            deck.reset();
+            deck.deal(9)
+        });
+    });
+}
+
+fn bench_equity(c: &mut Criterion) {
+    let request = EquityRequest::new(
+        vec![PlayerHand::new(cards("Ah Ad")), PlayerHand::new(cards("Kh Kd"))],
+        vec![],
+    )
+    .with_simulations(10_000)
+    .with_seed(42);
+    c.bench_function("calculate_equity/aa_vs_kk_10k", |b| {
+        b.iter(|| calculate_equity(black_box(&request)));
+    });
+}
+
+criterion_group!(benches, bench_evaluator, bench_draws, bench_cards, bench_equity);
+criterion_main!(benches);
@@ -4,11 +4,16 @@
 //!   cargo run --release --bin precompute -- --simulations 1000000
 //!   cargo run --release --bin precompute -- --players 2 --simulations 100000
 
-use holdem_core::canonize::{get_all_canonical_hands, get_all_combos, CanonicalHand};
-use holdem_core::equity::{calculate_equity, EquityRequest, PlayerHand};
+use holdem_core::canonize::CanonicalHand;
+use holdem_core::card::{sample_deals, Card};
+use holdem_core::evaluator::{evaluate_seven_batch, evaluate_seven_strength, HandStrength};
+use rand::rngs::SmallRng;
+use rand::SeedableRng;
 use std::collections::BTreeMap;
 use std::env;
-use std::fs;
+use std::fs::File;
+use std::io::{BufWriter, Write};
+use std::process;
 use std::time::Instant;
 
 #[cfg(feature = "parallel")]
@@ -24,6 +29,7 @@ fn main() {
     let mut simulations: u32 = 1_000_000;
     let mut players: Option<usize> = None;
     let mut output_dir: Option<String> = None;
+    let mut seed: Option<u64> = None;
 
     let mut i = 1;
     while i < args.len() {
@@ -37,6 +43,11 @@ fn main() {
             "--players" | "-p" => {
                 if i + 1 < args.len() {
                     players = args[i + 1].parse().ok();
+                    if players.is_some_and(|n| !(2..=10).contains(&n)) {
+                        eprintln!("Error: --players must be between 2 and 10");
+                        print_help();
+                        process::exit(2);
+                    }
                     i += 1;
                 }
             }
@@ -46,6 +57,12 @@ fn main() {
                     i += 1;
                 }
             }
+            "--seed" => {
+                if i + 1 < args.len() {
+                    seed = args[i + 1].parse().ok();
+                    i += 1;
+                }
+            }
             "--help" | "-h" => {
                 print_help();
                 return;
@@ -59,7 +76,7 @@ fn main() {
     let output_dir = output_dir.unwrap_or_else(|| DEFAULT_OUTPUT_DIR.to_string());
 
     // Get all canonical hands
-    let hands = get_all_canonical_hands();
+    let hands: &[CanonicalHand] = CanonicalHand::all();
 
     // Determine which player counts to compute
     let player_counts: Vec<usize> = match players {
@@ -78,7 +95,7 @@ fn main() {
     }
     println!("Output: {}/preflop-equity-{{N}}.json", output_dir);
     #[cfg(feature = "parallel")]
-    println!("Mode: Parallel (using all CPU cores)");
+    println!("Mode: Parallel (player counts and hands across all CPU cores)");
     #[cfg(not(feature = "parallel"))]
     println!("Mode: Sequential");
     println!("========================================");
@@ -86,69 +103,23 @@ fn main() {
 
     let total_start = Instant::now();
 
-    for &num_players in &player_counts {
-        println!("[{} players]", num_players);
-
-        let subtotal_start = Instant::now();
-
-        // Parallel version: compute all hands in parallel
-        #[cfg(feature = "parallel")]
-        let hand_results: Vec<_> = {
-            hands
-                .par_iter()
-                .enumerate()
-                .map(|(idx, hand)| {
-                    let equity = compute_hand_equity(hand, num_players, simulations);
-                    let equity_pct = (equity * 1000.0).round() / 10.0;
-                    (idx, hand.notation(), equity_pct)
-                })
-                .collect()
-        };
-
-        // Sequential version: compute hands one by one with progress
-        #[cfg(not(feature = "parallel"))]
-        let hand_results: Vec<_> = {
-            hands
-                .iter()
-                .enumerate()
-                .map(|(idx, hand)| {
-                    let hand_start = Instant::now();
-                    let equity = compute_hand_equity(hand, num_players, simulations);
-                    let equity_pct = (equity * 1000.0).round() / 10.0;
-                    let elapsed = hand_start.elapsed().as_secs_f64();
-                    println!(
-                        "[{:>3}/169] {:<4} ... {:>5.1}%  ({:.1}s)",
-                        idx + 1,
-                        hand.notation(),
-                        equity_pct,
-                        elapsed
-                    );
-                    (idx, hand.notation(), equity_pct)
-                })
-                .collect()
+    // Player counts are independent: run them concurrently, each with its own
+    // RNG stream (seeded from `--seed` + player count when given).
+    let run = |&num_players: &usize| {
+        let rng = match seed {
+            Some(s) => SmallRng::seed_from_u64(s.wrapping_add(num_players as u64)),
+            None => SmallRng::from_os_rng(),
         };
+        run_player_count(hands, num_players, simulations, rng, &output_dir);
+    };
 
-        // Build player results map (flat structure)
-        let mut player_results: BTreeMap<String, f64> = BTreeMap::new();
-        for (_, notation, equity_pct) in &hand_results {
-            player_results.insert(notation.clone(), *equity_pct);
-        }
-
-        let subtotal_elapsed = subtotal_start.elapsed();
-
-        // Save to file
-        let filename = format!("{}/preflop-equity-{}.json", output_dir, num_players);
-        let json = serde_json::to_string_pretty(&player_results).expect("Failed to serialize JSON");
-        fs::write(&filename, &json).expect("Failed to write output file");
+    #[cfg(feature = "parallel")]
+    player_counts.par_iter().for_each(run);
 
-        println!(
-            "Completed in {} → Saved: {}",
-            format_duration(subtotal_elapsed.as_secs()),
-            filename
-        );
-        println!();
-    }
+    #[cfg(not(feature = "parallel"))]
+    player_counts.iter().for_each(run);
 
+    println!();
     let total_elapsed = total_start.elapsed();
 
     println!("========================================");
@@ -156,85 +127,182 @@ fn main() {
     println!("========================================");
 }
 
-#[cfg(feature = "parallel")]
-fn compute_hand_equity(hand: &CanonicalHand, num_players: usize, simulations: u32) -> f64 {
-    use rayon::prelude::*;
+/// Compute, save and report the equity table for one player count
+fn run_player_count(
+    hands: &[CanonicalHand],
+    num_players: usize,
+    simulations: u32,
+    mut rng: SmallRng,
+    output_dir: &str,
+) {
+    let start = Instant::now();
+
+    let equities = calculate_all_preflop_equities(hands, num_players, simulations, &mut rng);
+
+    // Build player results map (flat structure)
+    let mut player_results: BTreeMap<String, f64> = BTreeMap::new();
+    for (hand, equity) in hands.iter().zip(&equities) {
+        let equity_pct = (equity * 1000.0).round() / 10.0;
+        player_results.insert(hand.notation(), equity_pct);
+    }
+
+    // Save to file (BTreeMap keeps keys sorted, so output is diff-stable)
+    let filename = format!("{}/preflop-equity-{}.json", output_dir, num_players);
+    let file = File::create(&filename).expect("Failed to create output file");
+    let mut writer = BufWriter::new(file);
+    serde_json::to_writer_pretty(&mut writer, &player_results).expect("Failed to serialize JSON");
+    writer.flush().expect("Failed to write output file");
+
+    println!(
+        "[{} players] Completed in {} → Saved: {}",
+        num_players,
+        format_duration(start.elapsed().as_secs()),
+        filename
+    );
+}
 
-    // Get all actual card combinations for this hand
-    let combos = get_all_combos(hand);
+/// Number of shared deals sampled and scored together before the next batch is drawn
+const BATCH_SIZE: usize = 1 << 14;
+
+/// One batch of random deals shared by every canonical hand.
+///
+/// Each deal is `(num_players - 1)` opponent hole-card pairs followed by a
+/// 5-card board, drawn from the full 52-card deck without replacement. The
+/// opponents' best hand only depends on the deal, so it is evaluated once per
+/// deal instead of once per deal per hero hand.
+struct DealBatch {
+    /// The 5 board cards of each deal
+    boards: Vec<[Card; 5]>,
+    /// Bitmask of all cards used by each deal (bit = `Card::to_index`)
+    masks: Vec<u64>,
+    /// Best opponent hand of each deal and how many opponents share it
+    best_opponents: Vec<(HandStrength, usize)>,
+}
 
-    if combos.is_empty() {
-        return 0.0;
-    }
+impl DealBatch {
+    fn sample(rng: &mut SmallRng, num_players: usize, size: usize) -> Self {
+        let opponents = num_players - 1;
+        let width = 2 * opponents + 5;
+        let deals = sample_deals(rng, size, width, 0);
 
-    let sims_per_combo = simulations / combos.len() as u32;
+        let mut boards = Vec::with_capacity(size);
+        let mut masks = Vec::with_capacity(size);
+        let mut opponent_hands = Vec::with_capacity(size * opponents);
 
-    // Parallelize across combos within each hand
-    let total_equity: f64 = combos
-        .par_iter()
-        .map(|(card1, card2)| {
-            // Build player hands: hero + (num_players - 1) random opponents
-            let mut players = vec![PlayerHand::new(vec![*card1, *card2])];
-            for _ in 1..num_players {
-                players.push(PlayerHand::random());
+        for deal in deals.chunks_exact(width) {
+            let board: [Card; 5] = deal[2 * opponents..].try_into().unwrap();
+            for hole in deal[..2 * opponents].chunks_exact(2) {
+                opponent_hands.push(seven_cards(hole[0], hole[1], &board));
             }
+            boards.push(board);
+            masks.push(deal.iter().fold(0u64, |m, c| m | c.bit()));
+        }
 
-            let request = EquityRequest::new(players, vec![]).with_simulations(sims_per_combo);
+        // Evaluate every opponent hand of the batch in one call
+        let strengths = evaluate_seven_batch(&opponent_hands);
+        let best_opponents = strengths
+            .chunks_exact(opponents)
+            .map(|deal| {
+                let best = *deal.iter().max().expect("at least one opponent");
+                (best, deal.iter().filter(|&&s| s == best).count())
+            })
+            .collect();
+
+        Self {
+            boards,
+            masks,
+            best_opponents,
+        }
+    }
 
-            match calculate_equity(&request) {
-                Ok(result) => {
-                    if !result.players.is_empty() {
-                        result.players[0].equity
-                    } else {
-                        0.0
-                    }
-                }
-                Err(e) => {
-                    eprintln!("Error computing {}: {}", hand.notation(), e);
-                    0.0
-                }
-            }
-        })
-        .sum();
+    fn len(&self) -> usize {
+        self.boards.len()
+    }
+}
 
-    total_equity / combos.len() as f64
+/// Running equity total for one canonical hand
+#[derive(Clone, Copy, Default)]
+struct HandTally {
+    equity_sum: f64,
+    deals: u64,
 }
 
-#[cfg(not(feature = "parallel"))]
-fn compute_hand_equity(hand: &CanonicalHand, num_players: usize, simulations: u32) -> f64 {
-    // Get all actual card combinations for this hand
-    let combos = get_all_combos(hand);
+fn seven_cards(c1: Card, c2: Card, board: &[Card; 5]) -> [Card; 7] {
+    [c1, c2, board[0], board[1], board[2], board[3], board[4]]
+}
 
-    if combos.is_empty() {
-        return 0.0;
-    }
+/// Score one hand against a batch, continuing its running tally.
+///
+/// `offset` is the global index of the batch's first deal; deal `i` is played
+/// with combo `i % combos.len()`, so every combo gets an equal share of deals.
+/// Deals that collide with the hero's cards are skipped.
+fn score_hand(combos: &[(Card, Card)], batch: &DealBatch, offset: usize, tally: &mut HandTally) {
+    for i in 0..batch.len() {
+        let (c1, c2) = combos[(offset + i) % combos.len()];
+        let hero_mask = c1.bit() | c2.bit();
+        if batch.masks[i] & hero_mask != 0 {
+            continue;
+        }
 
-    // Calculate equity for each combo and average
-    let mut total_equity = 0.0;
-    let sims_per_combo = simulations / combos.len() as u32;
+        let hero = evaluate_seven_strength(&seven_cards(c1, c2, &batch.boards[i]));
+        let (best, count) = &batch.best_opponents[i];
+        tally.equity_sum += match hero.cmp(best) {
+            std::cmp::Ordering::Greater => 1.0,
+            std::cmp::Ordering::Equal => 1.0 / (*count + 1) as f64,
+            std::cmp::Ordering::Less => 0.0,
+        };
+        tally.deals += 1;
+    }
+}
 
-    for (card1, card2) in &combos {
-        // Build player hands: hero + (num_players - 1) random opponents
-        let mut players = vec![PlayerHand::new(vec![*card1, *card2])];
-        for _ in 1..num_players {
-            players.push(PlayerHand::random());
-        }
+/// Compute the preflop equity of every canonical hand for one player count.
+///
+/// All hands are scored against the same stream of random deals. The number of
+/// deals is scaled up so that, after discarding deals that collide with the
+/// hero's hole cards, each hand still sees about `simulations` of them.
+fn calculate_all_preflop_equities(
+    hands: &[CanonicalHand],
+    num_players: usize,
+    simulations: u32,
+    rng: &mut SmallRng,
+) -> Vec<f64> {
+    let combos: Vec<&[(Card, Card)]> = hands.iter().map(CanonicalHand::combos).collect();
+
+    // Fraction of deals that avoid both hero cards: C(50, w) / C(52, w)
+    let width = 2 * (num_players - 1) + 5;
+    let survival = ((52 - width) * (51 - width)) as f64 / (52.0 * 51.0);
+    let total_deals = (f64::from(simulations) / survival).ceil() as usize;
+
+    let mut tallies = vec![HandTally::default(); hands.len()];
+    let mut offset = 0;
+    while offset < total_deals {
+        let size = BATCH_SIZE.min(total_deals - offset);
+        let batch = DealBatch::sample(rng, num_players, size);
 
-        let request = EquityRequest::new(players, vec![]).with_simulations(sims_per_combo);
+        #[cfg(feature = "parallel")]
+        tallies
+            .par_iter_mut()
+            .zip(combos.par_iter())
+            .for_each(|(tally, combos)| score_hand(combos, &batch, offset, tally));
 
-        match calculate_equity(&request) {
-            Ok(result) => {
-                if !result.players.is_empty() {
-                    total_equity += result.players[0].equity;
-                }
-            }
-            Err(e) => {
-                eprintln!("Error computing {}: {}", hand.notation(), e);
-            }
+        #[cfg(not(feature = "parallel"))]
+        for (tally, combos) in tallies.iter_mut().zip(&combos) {
+            score_hand(combos, &batch, offset, tally);
         }
+
+        offset += size;
     }
 
-    total_equity / combos.len() as f64
+    tallies
+        .iter()
+        .map(|t| {
+            if t.deals == 0 {
+                0.0
+            } else {
+                t.equity_sum / t.deals as f64
+            }
+        })
+        .collect()
 }
 
 fn format_number(n: u64) -> String {
@@ -269,6 +337,7 @@ fn print_help() {
     println!("  -s, --simulations N    Simulations per hand (default: 1,000,000)");
     println!("  -p, --players N        Only compute for N players (default: 2-10 all)");
     println!("  -o, --output DIR       Output directory (default: {})", DEFAULT_OUTPUT_DIR);
+    println!("      --seed N           Seed for reproducible results (default: random)");
     println!("  -h, --help             Show this help");
     println!();
     println!("Output files: preflop-equity-{{N}}.json (one per player count)");
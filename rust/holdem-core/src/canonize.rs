@@ -8,13 +8,167 @@
 
 use crate::card::{Card, Rank, Suit};
 use serde::{Deserialize, Serialize};
-use std::collections::HashSet;
-use std::fmt;
+use std::fmt::{self, Write as _};
+use std::hash::{Hash, Hasher};
 use std::str::FromStr;
 use thiserror::Error;
 
+/// Number of canonical starting hands
+pub const NUM_CANONICAL_HANDS: usize = 169;
+
+/// Canonical index for ranks given as values (2-14) with `high >= low`.
+///
+/// Indices follow `get_all_canonical_hands` order: pairs AA..22 (0-12),
+/// then suited (13-90) and offsuit (91-168) hands, each by descending ranks.
+const fn canonical_index(high: u8, low: u8, suited: bool) -> usize {
+    // Positions counted down from the ace (0 = A, 12 = 2), so hi <= lo
+    let hi = (14 - high) as usize;
+    let lo = (14 - low) as usize;
+    if hi == lo {
+        return hi;
+    }
+    let offset = hi * 13 - hi * (hi + 1) / 2 + (lo - hi - 1);
+    if suited { 13 + offset } else { 91 + offset }
+}
+
+/// All canonical hands, indexed by `CanonicalHand::index`
+///
+/// Enumerated in canonical order: pairs, then suited and offsuit hands, each
+/// walking ranks from the ace down.
+const CANONICAL_HANDS: [CanonicalHand; NUM_CANONICAL_HANDS] = {
+    let ranks = Rank::ALL_DESC;
+    let mut hands = [CanonicalHand::new_unchecked(Rank::Two, Rank::Two, false); NUM_CANONICAL_HANDS];
+    let mut n = 0;
+
+    // Pairs (13)
+    let mut i = 0;
+    while i < 13 {
+        hands[n] = CanonicalHand::new_unchecked(ranks[i], ranks[i], false);
+        n += 1;
+        i += 1;
+    }
+
+    // Suited (78), then offsuit (78) non-pairs
+    let mut pass = 0;
+    while pass < 2 {
+        let suited = pass == 0;
+        let mut i = 0;
+        while i < 13 {
+            let mut j = i + 1;
+            while j < 13 {
+                hands[n] = CanonicalHand::new_unchecked(ranks[i], ranks[j], suited);
+                n += 1;
+                j += 1;
+            }
+            i += 1;
+        }
+        pass += 1;
+    }
+    hands
+};
+
+/// Total number of hole-card combinations, C(52,2)
+const NUM_COMBOS: usize = 1326;
+
+/// Suit assignments (high card, low card) for each kind of canonical hand
+const PAIR_SUITS: [(Suit, Suit); 6] = [
+    (Suit::Clubs, Suit::Diamonds),
+    (Suit::Clubs, Suit::Hearts),
+    (Suit::Clubs, Suit::Spades),
+    (Suit::Diamonds, Suit::Hearts),
+    (Suit::Diamonds, Suit::Spades),
+    (Suit::Hearts, Suit::Spades),
+];
+const SUITED_SUITS: [(Suit, Suit); 4] = [
+    (Suit::Clubs, Suit::Clubs),
+    (Suit::Diamonds, Suit::Diamonds),
+    (Suit::Hearts, Suit::Hearts),
+    (Suit::Spades, Suit::Spades),
+];
+const OFFSUIT_SUITS: [(Suit, Suit); 12] = [
+    (Suit::Clubs, Suit::Diamonds),
+    (Suit::Clubs, Suit::Hearts),
+    (Suit::Clubs, Suit::Spades),
+    (Suit::Diamonds, Suit::Clubs),
+    (Suit::Diamonds, Suit::Hearts),
+    (Suit::Diamonds, Suit::Spades),
+    (Suit::Hearts, Suit::Clubs),
+    (Suit::Hearts, Suit::Diamonds),
+    (Suit::Hearts, Suit::Spades),
+    (Suit::Spades, Suit::Clubs),
+    (Suit::Spades, Suit::Diamonds),
+    (Suit::Spades, Suit::Hearts),
+];
+
+/// Hole-card combinations of every canonical hand, grouped by hand index.
+///
+/// Hand `i` owns `COMBOS[COMBO_OFFSETS[i]..COMBO_OFFSETS[i + 1]]`.
+const COMBOS: [(Card, Card); NUM_COMBOS] = build_combo_table().0;
+const COMBO_OFFSETS: [u16; NUM_CANONICAL_HANDS + 1] = build_combo_table().1;
+
+/// Card mask (`Card::bit` of both cards) of each entry in `COMBOS`
+const COMBO_MASKS: [u64; NUM_COMBOS] = {
+    let mut masks = [0u64; NUM_COMBOS];
+    let mut i = 0;
+    while i < NUM_COMBOS {
+        masks[i] = COMBOS[i].0.bit() | COMBOS[i].1.bit();
+        i += 1;
+    }
+    masks
+};
+
+const fn build_combo_table() -> ([(Card, Card); NUM_COMBOS], [u16; NUM_CANONICAL_HANDS + 1]) {
+    let filler = Card::new(Rank::Two, Suit::Clubs);
+    let mut combos = [(filler, filler); NUM_COMBOS];
+    let mut offsets = [0u16; NUM_CANONICAL_HANDS + 1];
+    let mut n = 0;
+    let mut h = 0;
+    while h < NUM_CANONICAL_HANDS {
+        let hand = CANONICAL_HANDS[h];
+        offsets[h] = n as u16;
+        let suits: &[(Suit, Suit)] = if hand.high_rank as u8 == hand.low_rank as u8 {
+            &PAIR_SUITS
+        } else if hand.suited {
+            &SUITED_SUITS
+        } else {
+            &OFFSUIT_SUITS
+        };
+        let mut k = 0;
+        while k < suits.len() {
+            combos[n] = (
+                Card::new(hand.high_rank, suits[k].0),
+                Card::new(hand.low_rank, suits[k].1),
+            );
+            n += 1;
+            k += 1;
+        }
+        h += 1;
+    }
+    offsets[NUM_CANONICAL_HANDS] = n as u16;
+    (combos, offsets)
+}
+
+/// Canonical index for every ordered pair of card indices (`Card::to_index`)
+const CANONICAL_INDEX_BY_CARDS: [[u8; 52]; 52] = {
+    let mut table = [[0u8; 52]; 52];
+    let mut a = 0;
+    while a < 52 {
+        let mut b = 0;
+        while b < 52 {
+            // Card index = (rank - 2) * 4 + suit
+            let (ra, rb) = (a as u8 / 4 + 2, b as u8 / 4 + 2);
+            let suited = a % 4 == b % 4 && ra != rb;
+            let (high, low) = if ra >= rb { (ra, rb) } else { (rb, ra) };
+            table[a][b] = canonical_index(high, low, suited) as u8;
+            b += 1;
+        }
+        a += 1;
+    }
+    table
+};
+
 /// A canonical (strategically equivalent) starting hand.
-#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash, Serialize, Deserialize)]
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Serialize, Deserialize)]
 pub struct CanonicalHand {
     /// The higher rank (or equal for pairs)
     pub high_rank: Rank,
@@ -30,29 +184,76 @@ impl CanonicalHand {
     /// # Panics
     /// Panics if high_rank < low_rank or if pair is marked as suited
     #[must_use]
-    pub fn new(high_rank: Rank, low_rank: Rank, suited: bool) -> Self {
+    pub const fn new(high_rank: Rank, low_rank: Rank, suited: bool) -> Self {
         assert!(
-            high_rank >= low_rank,
+            high_rank as u8 >= low_rank as u8,
             "high_rank must be >= low_rank"
         );
         assert!(
-            !(high_rank == low_rank && suited),
+            !(high_rank as u8 == low_rank as u8 && suited),
             "pairs cannot be suited"
         );
 
-        Self { high_rank, low_rank, suited }
+        Self::new_unchecked(high_rank, low_rank, suited)
     }
 
     /// Try to create a canonical hand, returning None if invalid
     #[must_use]
-    pub fn try_new(high_rank: Rank, low_rank: Rank, suited: bool) -> Option<Self> {
-        if high_rank < low_rank {
+    pub const fn try_new(high_rank: Rank, low_rank: Rank, suited: bool) -> Option<Self> {
+        if (high_rank as u8) < low_rank as u8 {
             return None;
         }
-        if high_rank == low_rank && suited {
+        if high_rank as u8 == low_rank as u8 && suited {
             return None;
         }
-        Some(Self { high_rank, low_rank, suited })
+        Some(Self::new_unchecked(high_rank, low_rank, suited))
+    }
+
+    /// Create a canonical hand whose invariants the caller has already checked
+    const fn new_unchecked(high_rank: Rank, low_rank: Rank, suited: bool) -> Self {
+        debug_assert!(high_rank as u8 >= low_rank as u8);
+        debug_assert!(!(high_rank as u8 == low_rank as u8 && suited));
+        Self { high_rank, low_rank, suited }
+    }
+
+    /// Get the canonical index (0-168), in `get_all_canonical_hands` order
+    ///
+    /// The fields are public (and deserializable), so the ranks are ordered
+    /// here rather than trusted; a suited pair indexes as the plain pair.
+    #[must_use]
+    pub const fn index(&self) -> usize {
+        let (a, b) = (self.high_rank.value(), self.low_rank.value());
+        let (high, low) = if a >= b { (a, b) } else { (b, a) };
+        canonical_index(high, low, self.suited)
+    }
+
+    /// Get the canonical hand for an index (0-168)
+    #[must_use]
+    pub fn from_index(index: usize) -> Option<Self> {
+        CANONICAL_HANDS.get(index).copied()
+    }
+
+    /// Get all 169 canonical hands, in index order
+    #[must_use]
+    pub fn all() -> &'static [CanonicalHand; NUM_CANONICAL_HANDS] {
+        &CANONICAL_HANDS
+    }
+
+    /// Get all actual card combinations for this hand (precomputed)
+    #[must_use]
+    pub fn combos(&self) -> &'static [(Card, Card)] {
+        &COMBOS[self.combo_range()]
+    }
+
+    /// Get the card mask of each combo, parallel to `combos()`
+    #[must_use]
+    pub fn combo_masks(&self) -> &'static [u64] {
+        &COMBO_MASKS[self.combo_range()]
+    }
+
+    fn combo_range(&self) -> std::ops::Range<usize> {
+        let index = self.index();
+        COMBO_OFFSETS[index] as usize..COMBO_OFFSETS[index + 1] as usize
     }
 
     /// Check if this is a pocket pair
@@ -85,16 +286,7 @@ impl CanonicalHand {
     /// Get notation string (e.g., "AKs", "QQ", "72o")
     #[must_use]
     pub fn notation(&self) -> String {
-        if self.is_pair() {
-            format!("{}{}", self.high_rank.to_char(), self.low_rank.to_char())
-        } else {
-            format!(
-                "{}{}{}",
-                self.high_rank.to_char(),
-                self.low_rank.to_char(),
-                if self.suited { 's' } else { 'o' }
-            )
-        }
+        self.to_string()
     }
 
     /// Parse from notation string
@@ -105,9 +297,15 @@ impl CanonicalHand {
             return Err(CanonizeError::InvalidFormat(s.to_string()));
         }
 
-        let chars: Vec<char> = s.chars().collect();
-        let rank1 = Rank::from_char(chars[0]).ok_or(CanonizeError::InvalidRank(chars[0]))?;
-        let rank2 = Rank::from_char(chars[1]).ok_or(CanonizeError::InvalidRank(chars[1]))?;
+        // Walk the chars in place; a 2-3 byte string can hold a single
+        // multi-byte char, so the second one is not guaranteed
+        let mut chars = s.chars();
+        let (Some(c1), Some(c2)) = (chars.next(), chars.next()) else {
+            return Err(CanonizeError::InvalidFormat(s.to_string()));
+        };
+        let suffix = chars.next();
+        let rank1 = Rank::from_char(c1).ok_or(CanonizeError::InvalidRank(c1))?;
+        let rank2 = Rank::from_char(c2).ok_or(CanonizeError::InvalidRank(c2))?;
 
         // Normalize so high >= low
         let (high_rank, low_rank) = if rank1 >= rank2 {
@@ -117,8 +315,8 @@ impl CanonicalHand {
         };
 
         // Determine suitedness
-        let suited = if chars.len() == 3 {
-            match chars[2].to_ascii_lowercase() {
+        let suited = if let Some(suffix) = suffix {
+            match suffix.to_ascii_lowercase() {
                 's' => true,
                 'o' => false,
                 c => return Err(CanonizeError::InvalidSuited(c)),
@@ -136,7 +334,7 @@ impl CanonicalHand {
             return Err(CanonizeError::PairCannotBeSuited);
         }
 
-        Ok(Self { high_rank, low_rank, suited })
+        Ok(Self::new_unchecked(high_rank, low_rank, suited))
     }
 
     /// Get row index for 13x13 matrix display (0 = AA row)
@@ -168,9 +366,25 @@ impl CanonicalHand {
     }
 }
 
+/// Hashes the three fields packed into one `u16`, so set and map lookups
+/// do a single hasher write instead of one per field
+impl Hash for CanonicalHand {
+    fn hash<H: Hasher>(&self, state: &mut H) {
+        let packed = (u16::from(self.high_rank.value()) << 5)
+            | (u16::from(self.low_rank.value()) << 1)
+            | u16::from(self.suited);
+        state.write_u16(packed);
+    }
+}
+
 impl fmt::Display for CanonicalHand {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        write!(f, "{}", self.notation())
+        f.write_char(self.high_rank.to_char())?;
+        f.write_char(self.low_rank.to_char())?;
+        if !self.is_pair() {
+            f.write_char(if self.suited { 's' } else { 'o' })?;
+        }
+        Ok(())
     }
 }
 
@@ -199,109 +413,53 @@ pub enum CanonizeError {
     InvalidCardCount,
 }
 
-/// Convert two hole cards to their canonical form
+/// Get the canonical index (0-168) of two hole cards given by `Card::to_index`
+///
+/// # Panics
+/// Panics if either index is not a valid card index (0-51)
 #[must_use]
-pub fn canonize_hole_cards(cards: &[Card; 2]) -> CanonicalHand {
-    let (high, low) = if cards[0].rank >= cards[1].rank {
-        (cards[0], cards[1])
-    } else {
-        (cards[1], cards[0])
-    };
-
-    let suited = high.suit == low.suit && high.rank != low.rank;
+pub const fn canonize_index(c1: u8, c2: u8) -> usize {
+    CANONICAL_INDEX_BY_CARDS[c1 as usize][c2 as usize] as usize
+}
 
-    CanonicalHand {
-        high_rank: high.rank,
-        low_rank: low.rank,
-        suited,
-    }
+/// Convert two hole cards to their canonical form
+#[must_use]
+pub const fn canonize_hole_cards(cards: &[Card; 2]) -> CanonicalHand {
+    CANONICAL_HANDS[canonize_index(cards[0].to_index(), cards[1].to_index())]
 }
 
 /// Get all actual card combinations for a canonical hand
 #[must_use]
 pub fn get_all_combos(hand: &CanonicalHand) -> Vec<(Card, Card)> {
-    let mut combos = Vec::new();
-
-    if hand.is_pair() {
-        // Pairs: all C(4,2) = 6 suit combinations
-        for i in 0..4 {
-            for j in (i + 1)..4 {
-                combos.push((
-                    Card::new(hand.high_rank, Suit::ALL[i]),
-                    Card::new(hand.low_rank, Suit::ALL[j]),
-                ));
-            }
-        }
-    } else if hand.suited {
-        // Suited: 4 combinations (same suit)
-        for suit in Suit::ALL {
-            combos.push((
-                Card::new(hand.high_rank, suit),
-                Card::new(hand.low_rank, suit),
-            ));
-        }
-    } else {
-        // Offsuit: 12 combinations (different suits)
-        for suit1 in Suit::ALL {
-            for suit2 in Suit::ALL {
-                if suit1 != suit2 {
-                    combos.push((
-                        Card::new(hand.high_rank, suit1),
-                        Card::new(hand.low_rank, suit2),
-                    ));
-                }
-            }
-        }
-    }
-
-    combos
+    hand.combos().to_vec()
 }
 
 /// Get combinations excluding dead cards
 #[must_use]
 pub fn get_combos_excluding(hand: &CanonicalHand, dead_cards: &[Card]) -> Vec<(Card, Card)> {
-    let dead_set: HashSet<Card> = dead_cards.iter().copied().collect();
+    let dead_mask = dead_cards.iter().fold(0u64, |mask, c| mask | c.bit());
 
-    get_all_combos(hand)
-        .into_iter()
-        .filter(|(c1, c2)| !dead_set.contains(c1) && !dead_set.contains(c2))
+    hand.combos()
+        .iter()
+        .zip(hand.combo_masks())
+        .filter(|&(_, &mask)| dead_mask & mask == 0)
+        .map(|(&combo, _)| combo)
         .collect()
 }
 
 /// Get all 169 canonical starting hands
+///
+/// Order: pairs (AA..22), then suited and offsuit hands by descending ranks.
 #[must_use]
 pub fn get_all_canonical_hands() -> Vec<CanonicalHand> {
-    let mut hands = Vec::with_capacity(169);
-
-    // All ranks in descending order
-    let ranks: Vec<Rank> = Rank::ALL.iter().copied().rev().collect();
-
-    // Pairs (13)
-    for &rank in &ranks {
-        hands.push(CanonicalHand::new(rank, rank, false));
-    }
-
-    // Suited non-pairs (78)
-    for (i, &high) in ranks.iter().enumerate() {
-        for &low in &ranks[(i + 1)..] {
-            hands.push(CanonicalHand::new(high, low, true));
-        }
-    }
-
-    // Offsuit non-pairs (78)
-    for (i, &high) in ranks.iter().enumerate() {
-        for &low in &ranks[(i + 1)..] {
-            hands.push(CanonicalHand::new(high, low, false));
-        }
-    }
-
-    hands
+    CANONICAL_HANDS.to_vec()
 }
 
 /// Check if two specific hole cards are strategically equivalent
 #[must_use]
-pub fn are_strategically_equivalent(hand1: &[Card; 2], hand2: &[Card; 2]) -> bool {
-    canonize_hole_cards(hand1) == canonize_hole_cards(hand2)
+pub const fn are_strategically_equivalent(hand1: &[Card; 2], hand2: &[Card; 2]) -> bool {
+    canonize_index(hand1[0].to_index(), hand1[1].to_index())
+        == canonize_index(hand2[0].to_index(), hand2[1].to_index())
 }
 
 /// Extended info for UI display
@@ -334,6 +492,7 @@ impl From<&CanonicalHand> for CanonicalHandInfo {
 mod tests {
     use super::*;
     use crate::card::parse_cards;
+    use std::collections::HashSet;
 
     #[test]
     fn test_canonical_hand_pair() {
@@ -397,6 +556,14 @@ mod tests {
             CanonicalHand::parse("XK"),
             Err(CanonizeError::InvalidRank('X'))
         ));
+        assert!(matches!(
+            CanonicalHand::parse("\u{2660}"),
+            Err(CanonizeError::InvalidFormat(_))
+        ));
+        assert!(matches!(
+            CanonicalHand::parse("AKx"),
+            Err(CanonizeError::InvalidSuited('x'))
+        ));
     }
 
     #[test]
@@ -414,6 +581,60 @@ mod tests {
         assert_eq!(hand.notation(), "QQ");
     }
 
+    #[test]
+    fn test_canonical_index_roundtrip() {
+        for (i, hand) in get_all_canonical_hands().iter().enumerate() {
+            assert_eq!(hand.index(), i);
+            assert_eq!(CanonicalHand::from_index(i), Some(*hand));
+        }
+        assert_eq!(CanonicalHand::from_index(NUM_CANONICAL_HANDS), None);
+    }
+
+    #[test]
+    fn test_canonize_index_matches_combos() {
+        for hand in get_all_canonical_hands() {
+            for (c1, c2) in get_all_combos(&hand) {
+                assert_eq!(canonize_index(c1.to_index(), c2.to_index()), hand.index());
+                assert_eq!(canonize_index(c2.to_index(), c1.to_index()), hand.index());
+                assert_eq!(canonize_hole_cards(&[c2, c1]), hand);
+            }
+        }
+    }
+
+    #[test]
+    fn test_reversed_ranks_do_not_panic() {
+        // Not constructible through `new`, but the fields are public
+        let reversed = CanonicalHand { high_rank: Rank::King, low_rank: Rank::Ace, suited: true };
+        let aks = CanonicalHand::parse("AKs").unwrap();
+        assert_eq!(reversed.index(), aks.index());
+        assert_eq!(reversed.combos(), aks.combos());
+        assert_eq!(reversed.combo_masks().len(), 4);
+        assert_eq!(get_all_combos(&reversed).len(), 4);
+    }
+
+    #[test]
+    fn test_hash_distinguishes_all_hands() {
+        let set: HashSet<CanonicalHand> = CanonicalHand::all().iter().copied().collect();
+        assert_eq!(set.len(), NUM_CANONICAL_HANDS);
+        assert!(set.contains(&CanonicalHand::parse("AKs").unwrap()));
+        assert!(!set.contains(&CanonicalHand { high_rank: Rank::Ace, low_rank: Rank::Ace, suited: true }));
+    }
+
+    #[test]
+    fn test_combo_table_covers_all_cards() {
+        let mut seen = HashSet::new();
+        for hand in CanonicalHand::all() {
+            assert_eq!(hand.combos().len(), hand.num_combos());
+            assert_eq!(hand.combo_masks().len(), hand.num_combos());
+            for &(c1, c2) in hand.combos() {
+                assert_eq!(c1.rank(), hand.high_rank);
+                assert_eq!(c2.rank(), hand.low_rank);
+                assert!(seen.insert((c1.min(c2), c1.max(c2))));
+            }
+        }
+        assert_eq!(seen.len(), NUM_COMBOS);
+    }
+
     #[test]
     fn test_get_all_combos_pair() {
         let hand = CanonicalHand::new(Rank::Ace, Rank::Ace, false);
@@ -428,7 +649,7 @@ mod tests {
         assert_eq!(combos.len(), 4);
         // All combos should be same suit
         for (c1, c2) in &combos {
-            assert_eq!(c1.suit, c2.suit);
+            assert_eq!(c1.suit(), c2.suit());
         }
     }
 
@@ -439,10 +660,20 @@ mod tests {
         assert_eq!(combos.len(), 12);
         // All combos should be different suits
         for (c1, c2) in &combos {
-            assert_ne!(c1.suit, c2.suit);
+            assert_ne!(c1.suit(), c2.suit());
         }
     }
 
+    #[test]
+    fn test_combo_order() {
+        let aa = CanonicalHand::new(Rank::Ace, Rank::Ace, false);
+        assert_eq!(aa.combos()[0], (Card::new(Rank::Ace, Suit::Clubs), Card::new(Rank::Ace, Suit::Diamonds)));
+        assert_eq!(aa.combos()[5], (Card::new(Rank::Ace, Suit::Hearts), Card::new(Rank::Ace, Suit::Spades)));
+
+        let ako = CanonicalHand::new(Rank::Ace, Rank::King, false);
+        assert_eq!(ako.combos()[3], (Card::new(Rank::Ace, Suit::Diamonds), Card::new(Rank::King, Suit::Clubs)));
+    }
+
     #[test]
     fn test_get_combos_excluding() {
         let hand = CanonicalHand::new(Rank::Ace, Rank::Ace, false);
@@ -465,6 +696,13 @@ mod tests {
         assert_eq!(pairs, 13);
         assert_eq!(suited, 78);
         assert_eq!(offsuit, 78);
+
+        assert_eq!(hands[0].notation(), "AA");
+        assert_eq!(hands[12].notation(), "22");
+        assert_eq!(hands[13].notation(), "AKs");
+        assert_eq!(hands[90].notation(), "32s");
+        assert_eq!(hands[91].notation(), "AKo");
+        assert_eq!(hands[168].notation(), "32o");
     }
 
     #[test]
@@ -3,8 +3,7 @@
 use crate::error::{HoldemError, HoldemResult};
 use rand::prelude::*;
 use serde::{Deserialize, Serialize};
-use std::collections::HashSet;
-use std::fmt;
+use std::fmt::{self, Write as _};
 use std::str::FromStr;
 use thiserror::Error;
 
@@ -45,6 +44,17 @@ impl Rank {
         Rank::Ace,
     ];
 
+    /// All ranks in descending order (Ace first)
+    pub const ALL_DESC: [Rank; 13] = {
+        let mut ranks = Rank::ALL;
+        let mut i = 0;
+        while i < 13 {
+            ranks[i] = Rank::ALL[12 - i];
+            i += 1;
+        }
+        ranks
+    };
+
     /// Create rank from numeric value (2-14)
     #[must_use]
     pub fn from_value(v: u8) -> Option<Self> {
@@ -72,25 +82,17 @@ impl Rank {
         self as u8
     }
 
-    /// Parse from character ('2'-'9', 'T', 'J', 'Q', 'K', 'A')
+    /// Card mask with all four cards of this rank set (see `Card::bit`)
+    #[inline]
+    #[must_use]
+    pub const fn card_mask(self) -> u64 {
+        0xF << ((self as u8 - 2) * 4)
+    }
+
+    /// Parse from character ('2'-'9', 'T', 'J', 'Q', 'K', 'A', either case)
     #[must_use]
     pub fn from_char(c: char) -> Option<Self> {
-        match c.to_ascii_uppercase() {
-            '2' => Some(Rank::Two),
-            '3' => Some(Rank::Three),
-            '4' => Some(Rank::Four),
-            '5' => Some(Rank::Five),
-            '6' => Some(Rank::Six),
-            '7' => Some(Rank::Seven),
-            '8' => Some(Rank::Eight),
-            '9' => Some(Rank::Nine),
-            'T' => Some(Rank::Ten),
-            'J' => Some(Rank::Jack),
-            'Q' => Some(Rank::Queen),
-            'K' => Some(Rank::King),
-            'A' => Some(Rank::Ace),
-            _ => None,
-        }
+        if c.is_ascii() { RANK_BY_ASCII[c as usize] } else { None }
     }
 
     /// Convert to character
@@ -114,9 +116,22 @@ impl Rank {
     }
 }
 
+/// Rank for each ASCII character, upper and lower case pre-populated
+const RANK_BY_ASCII: [Option<Rank>; 128] = {
+    let mut table = [None; 128];
+    let mut i = 0;
+    while i < Rank::ALL.len() {
+        let c = Rank::ALL[i].to_char() as u8;
+        table[c as usize] = Some(Rank::ALL[i]);
+        table[c.to_ascii_lowercase() as usize] = Some(Rank::ALL[i]);
+        i += 1;
+    }
+    table
+};
+
 impl fmt::Display for Rank {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        write!(f, "{}", self.to_char())
+        f.write_char(self.to_char())
     }
 }
 
@@ -134,14 +149,17 @@ impl Suit {
     /// All suits
     pub const ALL: [Suit; 4] = [Suit::Clubs, Suit::Diamonds, Suit::Hearts, Suit::Spades];
 
-    /// Parse from character ('c', 'd', 'h', 's' or Unicode symbols)
+    /// Parse from character ('c', 'd', 'h', 's' in either case, or Unicode symbols)
     #[must_use]
     pub fn from_char(c: char) -> Option<Self> {
-        match c.to_ascii_lowercase() {
-            'c' | '♣' => Some(Suit::Clubs),
-            'd' | '♦' => Some(Suit::Diamonds),
-            'h' | '♥' => Some(Suit::Hearts),
-            's' | '♠' => Some(Suit::Spades),
+        if c.is_ascii() {
+            return SUIT_BY_ASCII[c as usize];
+        }
+        match c {
+            '♣' => Some(Suit::Clubs),
+            '♦' => Some(Suit::Diamonds),
+            '♥' => Some(Suit::Hearts),
+            '♠' => Some(Suit::Spades),
             _ => None,
         }
     }
@@ -157,6 +175,13 @@ impl Suit {
         }
     }
 
+    /// Card mask with all thirteen cards of this suit set (see `Card::bit`)
+    #[inline]
+    #[must_use]
+    pub const fn card_mask(self) -> u64 {
+        0x1_1111_1111_1111 << (self as u8)
+    }
+
     /// Convert to Unicode symbol
     #[must_use]
     pub const fn to_symbol(self) -> char {
@@ -169,52 +194,131 @@ impl Suit {
     }
 }
 
+/// Suit for each ASCII character, upper and lower case pre-populated
+const SUIT_BY_ASCII: [Option<Suit>; 128] = {
+    let mut table = [None; 128];
+    let mut i = 0;
+    while i < Suit::ALL.len() {
+        let c = Suit::ALL[i].to_char() as u8;
+        table[c as usize] = Some(Suit::ALL[i]);
+        table[c.to_ascii_uppercase() as usize] = Some(Suit::ALL[i]);
+        i += 1;
+    }
+    table
+};
+
 impl fmt::Display for Suit {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        write!(f, "{}", self.to_char())
+        f.write_char(self.to_char())
     }
 }
 
+/// Short string of every card ("Ah"), indexed by `Card::to_index`
+const CARD_STRS: [&str; 52] = [
+    "2c", "2d", "2h", "2s",
+    "3c", "3d", "3h", "3s",
+    "4c", "4d", "4h", "4s",
+    "5c", "5d", "5h", "5s",
+    "6c", "6d", "6h", "6s",
+    "7c", "7d", "7h", "7s",
+    "8c", "8d", "8h", "8s",
+    "9c", "9d", "9h", "9s",
+    "Tc", "Td", "Th", "Ts",
+    "Jc", "Jd", "Jh", "Js",
+    "Qc", "Qd", "Qh", "Qs",
+    "Kc", "Kd", "Kh", "Ks",
+    "Ac", "Ad", "Ah", "As",
+];
+
+/// Card string with Unicode suit symbol ("A♥"), indexed by `Card::to_index`
+const CARD_PRETTY: [&str; 52] = [
+    "2♣", "2♦", "2♥", "2♠",
+    "3♣", "3♦", "3♥", "3♠",
+    "4♣", "4♦", "4♥", "4♠",
+    "5♣", "5♦", "5♥", "5♠",
+    "6♣", "6♦", "6♥", "6♠",
+    "7♣", "7♦", "7♥", "7♠",
+    "8♣", "8♦", "8♥", "8♠",
+    "9♣", "9♦", "9♥", "9♠",
+    "T♣", "T♦", "T♥", "T♠",
+    "J♣", "J♦", "J♥", "J♠",
+    "Q♣", "Q♦", "Q♥", "Q♠",
+    "K♣", "K♦", "K♥", "K♠",
+    "A♣", "A♦", "A♥", "A♠",
+];
+
 /// A playing card with rank and suit
-#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash, Serialize, Deserialize)]
-pub struct Card {
-    pub rank: Rank,
-    pub suit: Suit,
+///
+/// Stored as its 0-51 index, so cards are one byte, compare and hash as
+/// integers, and map directly onto a bit in a `u64` card mask.
+/// Ordering follows the index (by rank, then suit).
+#[derive(Clone, Copy, PartialEq, Eq, PartialOrd, Ord, Hash, Serialize, Deserialize)]
+#[serde(from = "CardRepr", into = "CardRepr")]
+pub struct Card(u8);
+
+/// Serialized form of a card, kept as `{ rank, suit }`
+#[derive(Clone, Copy, Serialize, Deserialize)]
+struct CardRepr {
+    rank: Rank,
+    suit: Suit,
+}
+
+impl From<CardRepr> for Card {
+    fn from(repr: CardRepr) -> Self {
+        Self::new(repr.rank, repr.suit)
+    }
+}
+
+impl From<Card> for CardRepr {
+    fn from(card: Card) -> Self {
+        Self {
+            rank: card.rank(),
+            suit: card.suit(),
+        }
+    }
 }
 
 impl Card {
     /// Create a new card
     #[must_use]
     pub const fn new(rank: Rank, suit: Suit) -> Self {
-        Self { rank, suit }
+        Self((rank as u8 - 2) * 4 + suit as u8)
+    }
+
+    /// Get the rank
+    #[inline]
+    #[must_use]
+    pub const fn rank(self) -> Rank {
+        Rank::ALL[(self.0 >> 2) as usize]
+    }
+
+    /// Get the suit
+    #[inline]
+    #[must_use]
+    pub const fn suit(self) -> Suit {
+        Suit::ALL[(self.0 & 3) as usize]
     }
 
     /// Convert to 0-51 index
     /// Formula: (rank - 2) * 4 + suit
+    #[inline]
     #[must_use]
     pub const fn to_index(self) -> u8 {
-        (self.rank as u8 - 2) * 4 + self.suit as u8
+        self.0
     }
 
-    /// Create from 0-51 index
+    /// Get this card's bit in a 52-bit card mask (bit = `to_index`)
+    #[inline]
     #[must_use]
-    pub fn from_index(index: u8) -> Option<Self> {
-        if index >= 52 {
-            return None;
-        }
-        let rank_value = index / 4 + 2;
-        let suit_value = index % 4;
+    pub const fn bit(self) -> u64 {
+        1 << self.0
+    }
 
-        Some(Self {
-            rank: Rank::from_value(rank_value)?,
-            suit: match suit_value {
-                0 => Suit::Clubs,
-                1 => Suit::Diamonds,
-                2 => Suit::Hearts,
-                3 => Suit::Spades,
-                _ => return None,
-            },
-        })
+    /// Create from 0-51 index
+    #[inline]
+    #[must_use]
+    pub const fn from_index(index: u8) -> Option<Self> {
+        if index < 52 { Some(Self(index)) } else { None }
     }
 
     /// Parse from string (e.g., "Ah", "KS", "10c")
@@ -224,20 +328,17 @@ impl Card {
             return Err(ParseError::Empty);
         }
 
-        let chars: Vec<char> = s.chars().collect();
-
-        // Handle "10x" format
-        if chars.len() == 3 && chars[0] == '1' && chars[1] == '0' {
-            let suit = Suit::from_char(chars[2]).ok_or(ParseError::InvalidSuit(chars[2]))?;
-            return Ok(Self::new(Rank::Ten, suit));
-        }
-
-        if chars.len() != 2 {
-            return Err(ParseError::InvalidFormat(s.to_string()));
-        }
-
-        let rank = Rank::from_char(chars[0]).ok_or(ParseError::InvalidRank(chars[0]))?;
-        let suit = Suit::from_char(chars[1]).ok_or(ParseError::InvalidSuit(chars[1]))?;
+        // "Ah" or the "10x" form, read without collecting into a buffer
+        let mut chars = s.chars();
+        let (rank, suit_char) = match (chars.next(), chars.next(), chars.next(), chars.next()) {
+            (Some('1'), Some('0'), Some(suit_char), None) => (Rank::Ten, suit_char),
+            (Some(rank_char), Some(suit_char), None, _) => (
+                Rank::from_char(rank_char).ok_or(ParseError::InvalidRank(rank_char))?,
+                suit_char,
+            ),
+            _ => return Err(ParseError::InvalidFormat(s.to_string())),
+        };
+        let suit = Suit::from_char(suit_char).ok_or(ParseError::InvalidSuit(suit_char))?;
 
         Ok(Self::new(rank, suit))
     }
@@ -245,13 +346,13 @@ impl Card {
     /// Format with Unicode suit symbol
     #[must_use]
     pub fn pretty(self) -> String {
-        format!("{}{}", self.rank.to_char(), self.suit.to_symbol())
+        CARD_PRETTY[self.0 as usize].to_string()
     }
 }
 
 impl fmt::Display for Card {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        write!(f, "{}{}", self.rank.to_char(), self.suit.to_char())
+        f.write_str(CARD_STRS[self.0 as usize])
     }
 }
 
@@ -263,15 +364,12 @@ impl FromStr for Card {
     }
 }
 
-impl PartialOrd for Card {
-    fn partial_cmp(&self, other: &Self) -> Option<std::cmp::Ordering> {
-        Some(self.cmp(other))
-    }
-}
-
-impl Ord for Card {
-    fn cmp(&self, other: &Self) -> std::cmp::Ordering {
-        self.to_index().cmp(&other.to_index())
+impl fmt::Debug for Card {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.debug_struct("Card")
+            .field("rank", &self.rank())
+            .field("suit", &self.suit())
+            .finish()
     }
 }
 
@@ -290,55 +388,63 @@ pub enum ParseError {
 
 /// Parse multiple cards from a string
 /// Supports formats: "Ah Kh", "AhKh", "Ah, Kh"
+///
+/// Cards are tokenized in a single pass: separators (whitespace, commas) are
+/// skipped, then each card is a rank ("10" or one rank char) and a suit char.
 pub fn parse_cards(s: &str) -> Result<Vec<Card>, ParseError> {
+    // Trimmed first so blank input returns without allocating
     let s = s.trim();
     if s.is_empty() {
         return Ok(Vec::new());
     }
 
-    // Try splitting by whitespace or comma first
-    let parts: Vec<&str> = s.split([' ', ',', '\t']).filter(|p| !p.is_empty()).collect();
-
-    if parts.len() > 1 {
-        // Multiple parts separated by delimiter
-        parts.into_iter().map(Card::parse).collect()
-    } else {
-        // Try parsing as concatenated cards (e.g., "AhKh")
-        let chars: Vec<char> = s.chars().collect();
-        let mut cards = Vec::new();
-        let mut i = 0;
+    let mut cards = Vec::with_capacity(s.len() / 2);
+    let mut chars = s.chars().peekable();
 
-        while i < chars.len() {
-            // Check for "10x" format
-            if i + 2 < chars.len() && chars[i] == '1' && chars[i + 1] == '0' {
-                let suit = Suit::from_char(chars[i + 2]).ok_or(ParseError::InvalidSuit(chars[i + 2]))?;
-                cards.push(Card::new(Rank::Ten, suit));
-                i += 3;
-            } else if i + 1 < chars.len() {
-                let rank = Rank::from_char(chars[i]).ok_or(ParseError::InvalidRank(chars[i]))?;
-                let suit = Suit::from_char(chars[i + 1]).ok_or(ParseError::InvalidSuit(chars[i + 1]))?;
-                cards.push(Card::new(rank, suit));
-                i += 2;
-            } else {
-                return Err(ParseError::InvalidFormat(s.to_string()));
-            }
-        }
-
-        Ok(cards)
+    while let Some(c) = chars.find(|&c| !(c.is_whitespace() || c == ',')) {
+        let rank = if c == '1' && chars.peek() == Some(&'0') {
+            chars.next();
+            Rank::Ten
+        } else {
+            Rank::from_char(c).ok_or(ParseError::InvalidRank(c))?
+        };
+        let suit_char = chars
+            .next()
+            .ok_or_else(|| ParseError::InvalidFormat(s.to_string()))?;
+        let suit = Suit::from_char(suit_char).ok_or(ParseError::InvalidSuit(suit_char))?;
+        cards.push(Card::new(rank, suit));
     }
+
+    Ok(cards)
 }
 
 /// Format cards as string
 #[must_use]
 pub fn format_cards(cards: &[Card]) -> String {
-    cards.iter().map(ToString::to_string).collect::<Vec<_>>().join(" ")
+    let mut out = String::with_capacity(cards.len() * 3);
+    for (i, card) in cards.iter().enumerate() {
+        if i > 0 {
+            out.push(' ');
+        }
+        out.push_str(CARD_STRS[card.to_index() as usize]);
+    }
+    out
 }
 
 /// A deck of 52 playing cards
+///
+/// Cards live in a fixed buffer split into three regions:
+/// `[removed | dealt | remaining]`. Dealing and removing only move a cursor
+/// and swap cards between regions, so neither allocates nor shifts the buffer.
 pub struct Deck {
-    cards: Vec<Card>,
-    removed: HashSet<Card>,
-    rng: StdRng,
+    cards: [Card; 52],
+    /// Slot of each card in `cards`, indexed by `Card::to_index`
+    positions: [u8; 52],
+    /// Number of removed cards at the front of `cards`
+    removed: usize,
+    /// Start of the remaining (undealt) cards
+    top: usize,
+    rng: SmallRng,
 }
 
 impl Deck {
@@ -346,12 +452,14 @@ impl Deck {
     #[must_use]
     pub fn new(seed: Option<u64>) -> Self {
         let rng = match seed {
-            Some(s) => StdRng::seed_from_u64(s),
-            None => StdRng::from_os_rng(),
+            Some(s) => SmallRng::seed_from_u64(s),
+            None => SmallRng::from_os_rng(),
         };
         let mut deck = Self {
-            cards: Self::full_deck(),
-            removed: HashSet::new(),
+            cards: FULL_DECK,
+            positions: std::array::from_fn(|i| i as u8),
+            removed: 0,
+            top: 0,
             rng,
         };
         deck.shuffle();
@@ -361,27 +469,30 @@ impl Deck {
     /// Get all 52 cards in order
     #[must_use]
     pub fn full_deck() -> Vec<Card> {
-        let mut cards = Vec::with_capacity(52);
-        for rank in Rank::ALL {
-            for suit in Suit::ALL {
-                cards.push(Card::new(rank, suit));
-            }
-        }
-        cards
+        FULL_DECK.to_vec()
     }
 
     /// Reset deck to full 52 cards
+    ///
+    /// Dealt cards are returned to the deck; removed cards stay out.
     pub fn reset(&mut self) {
-        self.cards = Self::full_deck();
-        if !self.removed.is_empty() {
-            self.cards.retain(|c| !self.removed.contains(c));
-        }
+        self.top = self.removed;
         self.shuffle();
     }
 
     /// Shuffle the remaining cards
     pub fn shuffle(&mut self) {
-        self.cards.shuffle(&mut self.rng);
+        self.cards[self.top..].shuffle(&mut self.rng);
+        for slot in self.top..self.cards.len() {
+            self.positions[self.cards[slot].to_index() as usize] = slot as u8;
+        }
+    }
+
+    /// Swap two slots, keeping `positions` in sync
+    fn swap_slots(&mut self, a: usize, b: usize) {
+        self.cards.swap(a, b);
+        self.positions[self.cards[a].to_index() as usize] = a as u8;
+        self.positions[self.cards[b].to_index() as usize] = b as u8;
     }
 
     /// Deal n cards from the deck
@@ -389,13 +500,9 @@ impl Deck {
     /// # Errors
     /// Returns an error if there are not enough cards remaining.
     pub fn deal(&mut self, n: usize) -> HoldemResult<Vec<Card>> {
-        if n > self.cards.len() {
-            return Err(HoldemError::InsufficientCards {
-                requested: n,
-                available: self.cards.len(),
-            });
-        }
-        Ok(self.cards.drain(..n).collect())
+        let dealt = self.peek(n)?.to_vec();
+        self.top += n;
+        Ok(dealt)
     }
 
     /// Deal one card
@@ -403,7 +510,9 @@ impl Deck {
     /// # Errors
     /// Returns an error if the deck is empty.
     pub fn deal_one(&mut self) -> HoldemResult<Card> {
-        self.deal(1).map(|mut v| v.pop().unwrap())
+        let card = *self.peek(1)?.first().unwrap();
+        self.top += 1;
+        Ok(card)
     }
 
     /// Remove specific cards from the deck
@@ -412,17 +521,20 @@ impl Deck {
     /// Returns an error if a card is not in the deck or was already removed.
     pub fn remove(&mut self, cards: &[Card]) -> HoldemResult<()> {
         for card in cards {
-            if !self.cards.contains(card) {
-                if self.removed.contains(card) {
+            let slot = self.positions[card.to_index() as usize] as usize;
+            if slot < self.top {
+                if slot < self.removed {
                     return Err(HoldemError::CardAlreadyRemoved(card.to_string()));
                 }
                 return Err(HoldemError::CardNotInDeck(card.to_string()));
             }
 
-            if let Some(index) = self.cards.iter().position(|c| c == card) {
-                self.cards.remove(index);
-                self.removed.insert(*card);
-            }
+            // Move the card to the front of the remaining region, then swap it
+            // with the first dealt card so it joins the removed region.
+            self.swap_slots(slot, self.top);
+            self.swap_slots(self.top, self.removed);
+            self.removed += 1;
+            self.top += 1;
         }
         Ok(())
     }
@@ -430,25 +542,25 @@ impl Deck {
     /// Check if a card is in the deck
     #[must_use]
     pub fn contains(&self, card: Card) -> bool {
-        self.cards.contains(&card)
+        self.positions[card.to_index() as usize] as usize >= self.top
     }
 
     /// Get remaining card count
     #[must_use]
     pub fn len(&self) -> usize {
-        self.cards.len()
+        self.cards.len() - self.top
     }
 
     /// Check if deck is empty
     #[must_use]
     pub fn is_empty(&self) -> bool {
-        self.cards.is_empty()
+        self.len() == 0
     }
 
     /// Get remaining cards (without removing)
     #[must_use]
     pub fn remaining(&self) -> &[Card] {
-        &self.cards
+        &self.cards[self.top..]
     }
 
     /// Peek at the top n cards
@@ -456,13 +568,13 @@ impl Deck {
     /// # Errors
     /// Returns an error if there are not enough cards remaining.
     pub fn peek(&self, n: usize) -> HoldemResult<&[Card]> {
-        if n > self.cards.len() {
+        if n > self.len() {
             return Err(HoldemError::InsufficientCards {
                 requested: n,
-                available: self.cards.len(),
+                available: self.len(),
             });
         }
-        Ok(&self.cards[..n])
+        Ok(&self.cards[self.top..self.top + n])
     }
 }
 
@@ -474,38 +586,69 @@ impl Default for Deck {
 
 /// Pre-computed full deck as constant array
 pub const FULL_DECK: [Card; 52] = {
-    let mut cards = [Card { rank: Rank::Two, suit: Suit::Clubs }; 52];
+    let mut cards = [Card(0); 52];
     let mut i = 0;
-    let ranks = [
-        Rank::Two,
-        Rank::Three,
-        Rank::Four,
-        Rank::Five,
-        Rank::Six,
-        Rank::Seven,
-        Rank::Eight,
-        Rank::Nine,
-        Rank::Ten,
-        Rank::Jack,
-        Rank::Queen,
-        Rank::King,
-        Rank::Ace,
-    ];
-    let suits = [Suit::Clubs, Suit::Diamonds, Suit::Hearts, Suit::Spades];
-
-    let mut r = 0;
-    while r < 13 {
-        let mut s = 0;
-        while s < 4 {
-            cards[i] = Card { rank: ranks[r], suit: suits[s] };
-            i += 1;
-            s += 1;
-        }
-        r += 1;
+    while i < 52 {
+        cards[i] = Card(i as u8);
+        i += 1;
     }
     cards
 };
 
+/// Mask with a bit set for every card in the deck
+pub const FULL_DECK_MASK: u64 = (1 << 52) - 1;
+
+/// Combine cards into a 52-bit card mask (see `Card::bit`)
+#[must_use]
+pub fn cards_to_mask(cards: &[Card]) -> u64 {
+    cards.iter().fold(0, |mask, c| mask | c.bit())
+}
+
+/// Iterate the cards whose bits are set in `mask`, in index order
+///
+/// Bits above 51 are ignored.
+pub fn mask_to_cards(mask: u64) -> impl Iterator<Item = Card> {
+    let mut mask = mask & FULL_DECK_MASK;
+    std::iter::from_fn(move || {
+        if mask == 0 {
+            return None;
+        }
+        #[allow(clippy::cast_possible_truncation)]
+        let index = mask.trailing_zeros() as u8;
+        mask &= mask - 1;
+        Some(Card(index))
+    })
+}
+
+/// Sample `count` independent deals of `slots` distinct cards each.
+///
+/// Cards whose bit is set in `excluded` (see `Card::bit`) are never drawn, so
+/// callers do not need to reject colliding deals. Each deal is a partial
+/// Fisher-Yates shuffle of the live cards. Returns the deals back to back
+/// (`count * slots` cards, row-major).
+///
+/// # Panics
+/// Panics if `slots` exceeds the number of cards not excluded.
+pub fn sample_deals<R: Rng + ?Sized>(
+    rng: &mut R,
+    count: usize,
+    slots: usize,
+    excluded: u64,
+) -> Vec<Card> {
+    let mut live: Vec<Card> = FULL_DECK.into_iter().filter(|c| excluded & c.bit() == 0).collect();
+    assert!(slots <= live.len(), "cannot deal {slots} cards from {}", live.len());
+
+    let mut deals = Vec::with_capacity(count * slots);
+    for _ in 0..count {
+        for k in 0..slots {
+            let j = rng.random_range(k..live.len());
+            live.swap(k, j);
+        }
+        deals.extend_from_slice(&live[..slots]);
+    }
+    deals
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -516,6 +659,13 @@ mod tests {
         assert_eq!(Rank::Ace.value(), 14);
     }
 
+    #[test]
+    fn test_rank_all_desc() {
+        assert_eq!(Rank::ALL_DESC[0], Rank::Ace);
+        assert_eq!(Rank::ALL_DESC[12], Rank::Two);
+        assert!(Rank::ALL_DESC.windows(2).all(|w| w[0] > w[1]));
+    }
+
     #[test]
     fn test_rank_from_char() {
         assert_eq!(Rank::from_char('A'), Some(Rank::Ace));
@@ -541,6 +691,37 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_card_accessors() {
+        let card = Card::new(Rank::Queen, Suit::Diamonds);
+        assert_eq!(card.rank(), Rank::Queen);
+        assert_eq!(card.suit(), Suit::Diamonds);
+        assert_eq!(card.bit(), 1 << card.to_index());
+        assert_eq!(Card::from_index(52), None);
+        assert!(Card::new(Rank::Two, Suit::Spades) < Card::new(Rank::Three, Suit::Clubs));
+    }
+
+    #[test]
+    fn test_card_serde_shape() {
+        let card = Card::new(Rank::Ace, Suit::Hearts);
+        let json = serde_json::to_string(&card).unwrap();
+        assert_eq!(json, r#"{"rank":"Ace","suit":"Hearts"}"#);
+        assert_eq!(serde_json::from_str::<Card>(&json).unwrap(), card);
+        assert_eq!(format!("{card:?}"), "Card { rank: Ace, suit: Hearts }");
+    }
+
+    #[test]
+    fn test_card_strings() {
+        for card in FULL_DECK {
+            let expected = format!("{}{}", card.rank().to_char(), card.suit().to_char());
+            assert_eq!(card.to_string(), expected);
+            let pretty = format!("{}{}", card.rank().to_char(), card.suit().to_symbol());
+            assert_eq!(card.pretty(), pretty);
+        }
+        assert_eq!(format_cards(&parse_cards("Ah Kd 2c").unwrap()), "Ah Kd 2c");
+        assert_eq!(format_cards(&[]), "");
+    }
+
     #[test]
     fn test_card_parse() {
         assert_eq!(Card::parse("Ah"), Ok(Card::new(Rank::Ace, Suit::Hearts)));
@@ -548,6 +729,10 @@ mod tests {
         assert_eq!(Card::parse("AH"), Ok(Card::new(Rank::Ace, Suit::Hearts)));
         assert_eq!(Card::parse("10c"), Ok(Card::new(Rank::Ten, Suit::Clubs)));
         assert_eq!(Card::parse("Tc"), Ok(Card::new(Rank::Ten, Suit::Clubs)));
+        assert_eq!(Card::parse(" 2♠ "), Ok(Card::new(Rank::Two, Suit::Spades)));
+        assert_eq!(Card::parse("10x"), Err(ParseError::InvalidSuit('x')));
+        assert_eq!(Card::parse("Zh"), Err(ParseError::InvalidRank('Z')));
+        assert_eq!(Card::parse("AhK"), Err(ParseError::InvalidFormat("AhK".to_string())));
     }
 
     #[test]
@@ -562,6 +747,17 @@ mod tests {
 
         let cards = parse_cards("Ah, Kh").unwrap();
         assert_eq!(cards.len(), 2);
+
+        let err = parse_cards(" 10c,Js\tQd ♥A ").unwrap_err();
+        assert_eq!(err, ParseError::InvalidRank('♥'));
+
+        let cards = parse_cards("10cJs\tQd, 2♥").unwrap();
+        assert_eq!(format_cards(&cards), "Tc Js Qd 2h");
+
+        assert_eq!(parse_cards("").unwrap(), vec![]);
+        assert_eq!(parse_cards("  \t ").unwrap(), vec![]);
+        assert_eq!(parse_cards("AhK"), Err(ParseError::InvalidFormat("AhK".to_string())));
+        assert_eq!(parse_cards("Ax"), Err(ParseError::InvalidSuit('x')));
     }
 
     #[test]
@@ -590,6 +786,44 @@ mod tests {
         assert!(!deck.contains(kh));
     }
 
+    #[test]
+    fn test_deck_remove_errors() {
+        let mut deck = Deck::new(Some(7));
+        let ah = Card::new(Rank::Ace, Suit::Hearts);
+        deck.remove(&[ah]).unwrap();
+        assert!(matches!(deck.remove(&[ah]), Err(HoldemError::CardAlreadyRemoved(_))));
+
+        let dealt = deck.deal_one().unwrap();
+        assert!(!deck.contains(dealt));
+        assert!(matches!(deck.remove(&[dealt]), Err(HoldemError::CardNotInDeck(_))));
+
+        // Reset brings back dealt cards but not removed ones
+        deck.reset();
+        assert_eq!(deck.len(), 51);
+        assert!(deck.contains(dealt));
+        assert!(!deck.contains(ah));
+
+        let mut seen: Vec<Card> = deck.deal(51).unwrap();
+        seen.sort();
+        seen.dedup();
+        assert_eq!(seen.len(), 51);
+        assert!(deck.is_empty());
+    }
+
+    #[test]
+    fn test_sample_deals() {
+        let mut rng = StdRng::seed_from_u64(3);
+        let excluded = Card::new(Rank::Ace, Suit::Hearts).bit() | Card::new(Rank::Two, Suit::Clubs).bit();
+        let deals = sample_deals(&mut rng, 200, 9, excluded);
+        assert_eq!(deals.len(), 200 * 9);
+
+        for deal in deals.chunks_exact(9) {
+            let mask = deal.iter().fold(0u64, |m, c| m | c.bit());
+            assert_eq!(mask.count_ones(), 9);
+            assert_eq!(mask & excluded, 0);
+        }
+    }
+
     #[test]
     fn test_full_deck_const() {
         assert_eq!(FULL_DECK.len(), 52);
@@ -597,4 +831,27 @@ mod tests {
         assert_eq!(FULL_DECK[0], Card::new(Rank::Two, Suit::Clubs));
         assert_eq!(FULL_DECK[51], Card::new(Rank::Ace, Suit::Spades));
     }
+
+    #[test]
+    fn test_card_masks() {
+        let cards = parse_cards("Ah Kd 2c").unwrap();
+        let mask = cards_to_mask(&cards);
+        assert_eq!(mask.count_ones(), 3);
+
+        let mut sorted = cards.clone();
+        sorted.sort();
+        assert_eq!(mask_to_cards(mask).collect::<Vec<_>>(), sorted);
+        assert_eq!(mask_to_cards(FULL_DECK_MASK).collect::<Vec<_>>(), FULL_DECK.to_vec());
+
+        for rank in Rank::ALL {
+            let by_rank: Vec<Card> = mask_to_cards(rank.card_mask()).collect();
+            assert_eq!(by_rank.len(), 4);
+            assert!(by_rank.iter().all(|c| c.rank() == rank));
+        }
+        for suit in Suit::ALL {
+            let by_suit: Vec<Card> = mask_to_cards(suit.card_mask()).collect();
+            assert_eq!(by_suit.len(), 13);
+            assert!(by_suit.iter().all(|c| c.suit() == suit));
+        }
+    }
 }
@@ -2,11 +2,9 @@
 //!
 //! Analyzes hole cards + board to identify drawing hands and their outs.
 
-use crate::card::{Card, Rank, Suit, FULL_DECK};
+use crate::card::{cards_to_mask, mask_to_cards, Card, Rank, Suit, FULL_DECK_MASK};
 use crate::error::{HoldemError, HoldemResult};
-use crate::evaluator::{evaluate_hand, HandType};
 use serde::{Deserialize, Serialize};
-use std::collections::{HashMap, HashSet};
 
 /// Types of draws
 #[derive(Clone, Copy, Debug, PartialEq, Eq, Hash, Serialize, Deserialize)]
@@ -134,15 +132,67 @@ impl DrawAnalysis {
         });
         has_flush_draw && has_straight_draw
     }
+
+    /// Outs of the best (4-card) flush draw, or 0 if there is none
+    #[must_use]
+    pub fn flush_out_count(&self) -> usize {
+        self.flush_draws
+            .iter()
+            .filter(|d| d.draw_type() == DrawType::FlushDraw)
+            .map(FlushDraw::out_count)
+            .max()
+            .unwrap_or(0)
+    }
+
+    /// Unique outs across open-ended, gutshot and double-gutshot draws
+    #[must_use]
+    pub fn straight_out_count(&self) -> usize {
+        let outs = self
+            .straight_draws
+            .iter()
+            .filter(|d| {
+                matches!(
+                    d.draw_type,
+                    DrawType::OpenEnded | DrawType::Gutshot | DrawType::DoubleGutshot
+                )
+            })
+            .fold(0u64, |mask, d| mask | cards_to_mask(&d.outs));
+        outs.count_ones() as usize
+    }
+
+    /// The primary (strongest) draw type
+    ///
+    /// Priority: Flush > OESD > Double Gutshot > Gutshot > Backdoor
+    #[must_use]
+    pub fn primary_draw(&self) -> Option<DrawType> {
+        let has_flush = |t| self.flush_draws.iter().any(|d| d.draw_type() == t);
+        let has_straight = |t| self.straight_draws.iter().any(|d| d.draw_type == t);
+
+        if has_flush(DrawType::FlushDraw) {
+            Some(DrawType::FlushDraw)
+        } else if has_straight(DrawType::OpenEnded) {
+            Some(DrawType::OpenEnded)
+        } else if has_straight(DrawType::DoubleGutshot) {
+            Some(DrawType::DoubleGutshot)
+        } else if has_straight(DrawType::Gutshot) {
+            Some(DrawType::Gutshot)
+        } else if has_flush(DrawType::BackdoorFlush) {
+            Some(DrawType::BackdoorFlush)
+        } else if has_straight(DrawType::BackdoorStraight) {
+            Some(DrawType::BackdoorStraight)
+        } else {
+            None
+        }
+    }
 }
 
 /// Build a 14-bit rank mask for straight detection
 /// Bit 0 = Ace (low), Bits 1-13 = 2-A (high)
-fn build_rank_mask(cards: &[Card]) -> u16 {
+fn build_rank_mask<'a>(cards: impl IntoIterator<Item = &'a Card>) -> u16 {
     let mut mask: u16 = 0;
 
     for card in cards {
-        let rank = card.rank.value();
+        let rank = card.rank().value();
         // Set bit for rank (2=bit1, ..., A=bit13)
         mask |= 1 << (rank - 1);
 
@@ -155,30 +205,125 @@ fn build_rank_mask(cards: &[Card]) -> u16 {
     mask
 }
 
-/// Count bits set in a 16-bit value
-#[allow(clippy::cast_possible_truncation)]
-fn count_bits(n: u16) -> u8 {
-    n.count_ones() as u8
+/// Whether a `build_rank_mask` contains five consecutive ranks
+const fn contains_straight(mask: u16) -> bool {
+    mask & (mask >> 1) & (mask >> 2) & (mask >> 3) & (mask >> 4) != 0
 }
 
-/// Analyze flush draws
+/// Whether the cards already make a flush / a straight
+///
+/// Matches the best hand's type: a flush that is not a straight flush
+/// outranks a separate straight, so only the flush is reported then.
+fn made_flush_straight(all_cards: &[Card], rank_mask: u16) -> (bool, bool) {
+    // One 4-bit card counter per suit (at most 7 cards, so no carries);
+    // adding 3 sets a counter's top bit exactly when it holds 5 or more
+    let suit_counts = all_cards
+        .iter()
+        .fold(0u32, |counts, card| counts + (1 << (4 * card.suit() as u32)));
+    let flush_bits = (suit_counts + 0x3333) & 0x8888;
+    if flush_bits == 0 {
+        return (false, contains_straight(rank_mask));
+    }
+
+    let flush_suit = Suit::ALL[(flush_bits.trailing_zeros() / 4) as usize];
+    let suited = build_rank_mask(all_cards.iter().filter(|c| c.suit() == flush_suit));
+    (true, contains_straight(suited))
+}
+
+/// Popcount and gap offsets of one straight window pattern
+#[derive(Clone, Copy)]
+struct WindowInfo {
+    count: u8,
+    gap_count: u8,
+    gaps: [u8; 6],
+}
+
+impl WindowInfo {
+    /// Offsets (from the window start) of the missing ranks, ascending
+    fn gaps(&self) -> &[u8] {
+        &self.gaps[..self.gap_count as usize]
+    }
+}
+
+/// Build the info table for every `width`-bit window pattern
+const fn build_window_info<const N: usize>(width: u8) -> [WindowInfo; N] {
+    let mut table = [WindowInfo {
+        count: 0,
+        gap_count: 0,
+        gaps: [0; 6],
+    }; N];
+    let mut pattern = 0;
+    while pattern < N {
+        let mut info = table[pattern];
+        let mut bit = 0;
+        while bit < width {
+            if pattern & (1 << bit) == 0 {
+                info.gaps[info.gap_count as usize] = bit;
+                info.gap_count += 1;
+            } else {
+                info.count += 1;
+            }
+            bit += 1;
+        }
+        table[pattern] = info;
+        pattern += 1;
+    }
+    table
+}
+
+/// Window info indexed by the 5 rank bits of a straight window
+static FIVE_WINDOW_INFO: [WindowInfo; 32] = build_window_info(5);
+
+/// Window info indexed by the 6 rank bits of a double-gutshot window
+static SIX_WINDOW_INFO: [WindowInfo; 64] = build_window_info(6);
+
+/// A flush draw with its outs as a card mask, before conversion to `FlushDraw`
+#[derive(Clone, Copy)]
+struct FlushCandidate {
+    suit: Suit,
+    cards_held: usize,
+    outs: u64,
+    is_nut: bool,
+}
+
+impl From<FlushCandidate> for FlushDraw {
+    fn from(c: FlushCandidate) -> Self {
+        FlushDraw {
+            suit: c.suit,
+            cards_held: c.cards_held,
+            outs: mask_to_cards(c.outs).collect(),
+            is_nut: c.is_nut,
+        }
+    }
+}
+
+/// Analyze flush draws, one slot per suit
+///
+/// `all_cards` is hole cards followed by board; `known` is the card mask of
+/// hole cards, board and dead cards.
 fn analyze_flush_draws(
     hole_cards: &[Card],
     board: &[Card],
-    dead_cards: &HashSet<Card>,
-) -> Vec<FlushDraw> {
-    let mut draws = Vec::new();
-    let all_cards: Vec<Card> = hole_cards.iter().chain(board.iter()).copied().collect();
+    all_cards: &[Card],
+    known: u64,
+) -> [Option<FlushCandidate>; 4] {
+    let mut draws = [None; 4];
+
+    // Count cards per suit
+    let mut suit_counts = [0usize; 4];
+    for card in all_cards {
+        suit_counts[card.suit() as usize] += 1;
+    }
 
-    // Group by suit
-    let mut by_suit: HashMap<Suit, Vec<Card>> = HashMap::new();
-    for &card in &all_cards {
-        by_suit.entry(card.suit).or_default().push(card);
+    // Hero's highest rank in each suit (0 if none), computed once for all suits
+    let mut hero_high_by_suit = [0u8; 4];
+    for card in hole_cards {
+        let high = &mut hero_high_by_suit[card.suit() as usize];
+        *high = (*high).max(card.rank().value());
     }
 
     // Check each suit
-    for (suit, cards) in by_suit {
-        let count = cards.len();
+    for (suit, count) in Suit::ALL.into_iter().zip(suit_counts) {
 
         // Need at least 3 for backdoor or 4 for regular flush draw
         if count < 3 {
@@ -191,45 +336,26 @@ fn analyze_flush_draws(
         }
 
         // Find outs (remaining cards of this suit)
-        let outs: Vec<Card> = FULL_DECK
-            .iter()
-            .filter(|c| c.suit == suit && !all_cards.contains(c) && !dead_cards.contains(c))
-            .copied()
-            .collect();
+        let live = suit.card_mask() & !known;
 
         // Check if hero has the nut flush draw:
         // Hero holds the highest suited card among all cards that could be
         // held by opponents (i.e., not on board, not dead)
-        let hero_suited: Vec<Card> = hole_cards
-            .iter()
-            .filter(|c| c.suit == suit)
-            .copied()
-            .collect();
-        let hero_highest = hero_suited.iter().map(|c| c.rank as u8).max().unwrap_or(0);
+        let hero_highest = hero_high_by_suit[suit as usize];
 
-        // Check if any higher card of this suit could be held by opponents
-        // (not in hero's hand, not on board, not dead)
-        let all_known: HashSet<Card> = all_cards
-            .iter()
-            .copied()
-            .chain(dead_cards.iter().copied())
-            .collect();
-        let mut is_nut = true;
-        for rank in Rank::ALL {
-            if (rank as u8) > hero_highest {
-                let higher_card = Card::new(rank, suit);
-                if !all_known.contains(&higher_card) {
-                    // A higher card is still live - could be held by opponent
-                    is_nut = false;
-                    break;
-                }
-            }
-        }
+        // Any live card of this suit ranked above hero's could be held by an
+        // opponent. Cards of rank r occupy bits (r - 2) * 4 ..
+        let above = if hero_highest == 0 {
+            FULL_DECK_MASK
+        } else {
+            FULL_DECK_MASK << ((hero_highest - 1) * 4)
+        };
+        let is_nut = live & above == 0;
 
-        draws.push(FlushDraw {
+        draws[suit as usize] = Some(FlushCandidate {
             suit,
             cards_held: count,
-            outs,
+            outs: live,
             is_nut,
         });
     }
@@ -237,32 +363,89 @@ fn analyze_flush_draws(
     draws
 }
 
-/// Analyze straight draws using bitmask
-fn analyze_straight_draws(
-    hole_cards: &[Card],
-    board: &[Card],
-    dead_cards: &HashSet<Card>,
-) -> Vec<StraightDraw> {
-    let mut draws = Vec::new();
-    let all_cards: Vec<Card> = hole_cards.iter().chain(board.iter()).copied().collect();
-    let mask = build_rank_mask(&all_cards);
+/// Card mask of the live cards of each rank value (2-14; other slots empty)
+fn live_by_rank(known: u64) -> [u64; 15] {
+    let mut table = [0; 15];
+    for rank in Rank::ALL {
+        table[usize::from(rank.value())] = rank.card_mask() & !known;
+    }
+    table
+}
+
+/// A straight draw with its outs as a card mask, before conversion to
+/// `StraightDraw`
+#[derive(Clone, Copy)]
+struct StraightCandidate {
+    draw_type: DrawType,
+    needed: [u8; 2],
+    needed_len: u8,
+    outs: u64,
+    high_card: u8,
+    is_nut: bool,
+}
+
+impl StraightCandidate {
+    fn needed_ranks(&self) -> &[u8] {
+        &self.needed[..usize::from(self.needed_len)]
+    }
+}
+
+impl From<StraightCandidate> for StraightDraw {
+    fn from(c: StraightCandidate) -> Self {
+        StraightDraw {
+            draw_type: c.draw_type,
+            needed_ranks: c.needed_ranks().to_vec(),
+            outs: mask_to_cards(c.outs).collect(),
+            high_card: c.high_card,
+            is_nut: c.is_nut,
+        }
+    }
+}
+
+/// Deduplicate: keep the best draw for each high card (5-14), in a slot
+/// indexed by the high card
+fn keep_best(slots: &mut [Option<StraightCandidate>; 15], draw: StraightCandidate) {
+    let slot = &mut slots[usize::from(draw.high_card)];
+    // Prefer by: out count desc, then draw type priority
+    if slot.is_none_or(|existing| draw.outs.count_ones() > existing.outs.count_ones()) {
+        *slot = Some(draw);
+    }
+}
+
+/// Rank values needed to fill the given gap offsets of a window at `start`
+fn gap_ranks(start: u8, gaps: &[u8]) -> [u8; 2] {
+    let mut needed = [0; 2];
+    for (slot, &g) in needed.iter_mut().zip(gaps) {
+        let bit = start + g;
+        *slot = if bit == 0 { 14 } else { bit + 1 };
+    }
+    needed
+}
+
+/// Analyze straight draws using bitmask, keeping the best draw per high card
+///
+/// `mask` is the `build_rank_mask` of hole cards and board; `known` is the
+/// card mask of hole cards, board and dead cards. Slots are indexed by the
+/// completed straight's high card (5-14).
+fn analyze_straight_draws(mask: u16, board: &[Card], known: u64) -> [Option<StraightCandidate>; 15] {
+    let mut draws = [None; 15];
+    // Outs per needed rank, computed once for every window below
+    let live = live_by_rank(known);
 
     // Check all possible 5-card windows
     // Window starting positions: 0 (A-5) through 9 (T-A)
     for start in 0..=9 {
-        let window_mask: u16 = 0b11111 << start;
-        let present = mask & window_mask;
-        let present_count = count_bits(present);
+        let info = &FIVE_WINDOW_INFO[usize::from((mask >> start) & 0b11111)];
 
-        if present_count == 5 {
+        if info.count == 5 {
             // Already have a straight in this window, skip
             continue;
         }
 
-        if present_count == 4 {
+        if info.count == 4 {
             // One gap - either OESD or gutshot
-            let missing_mask = window_mask & !mask;
-            let missing_bit = missing_mask.trailing_zeros() as u8;
+            let gap = info.gaps[0];
+            let missing_bit = start as u8 + gap;
 
             // Calculate high card of this straight
             let high_card = if start == 0 { 5 } else { start as u8 + 5 };
@@ -278,16 +461,10 @@ fn analyze_straight_draws(
             };
 
             // Get outs (all 4 suits of needed rank)
-            let outs: Vec<Card> = FULL_DECK
-                .iter()
-                .filter(|c| {
-                    c.rank.value() == needed_rank && !all_cards.contains(c) && !dead_cards.contains(c)
-                })
-                .copied()
-                .collect();
+            let outs = live[usize::from(needed_rank)];
 
             // Determine draw type
-            let draw_type = if missing_bit == 0 || missing_bit == (start as u8 + 4) {
+            let draw_type = if missing_bit == 0 || gap == 4 {
                 // Gap at the edge - gutshot
                 DrawType::Gutshot
             } else {
@@ -297,23 +474,9 @@ fn analyze_straight_draws(
                 let has_open_end_high = start < 9 && (mask & (1 << (start + 5))) == 0;
 
                 if has_open_end_low || has_open_end_high {
-                    // This is part of an OESD if we have 4 consecutive cards
-                    // Check if the 4 present cards are consecutive
-                    let mut consecutive = true;
-                    let mut prev_bit: Option<u8> = None;
-                    for bit in 0..5 {
-                        if (present >> (start + bit)) & 1 == 1 {
-                            if let Some(p) = prev_bit {
-                                if bit != p + 1 {
-                                    consecutive = false;
-                                    break;
-                                }
-                            }
-                            prev_bit = Some(bit);
-                        }
-                    }
-
-                    if consecutive {
+                    // This is part of an OESD if we have 4 consecutive cards,
+                    // i.e. the window's single gap sits at one of its ends
+                    if gap == 0 || gap == 4 {
                         DrawType::OpenEnded
                     } else {
                         DrawType::Gutshot
@@ -323,10 +486,11 @@ fn analyze_straight_draws(
                 }
             };
 
-            if !outs.is_empty() {
-                draws.push(StraightDraw {
+            if outs != 0 {
+                keep_best(&mut draws, StraightCandidate {
                     draw_type,
-                    needed_ranks: vec![needed_rank],
+                    needed: [needed_rank, 0],
+                    needed_len: 1,
                     outs,
                     high_card,
                     is_nut,
@@ -339,48 +503,26 @@ fn analyze_straight_draws(
     // Only meaningful when more cards are to come (not on river)
     if board.len() < 5 {
     for start in 0..=8 {
-        let window_mask: u16 = 0b111111 << start;
-        let present = mask & window_mask;
-        let present_count = count_bits(present);
+        let info = &SIX_WINDOW_INFO[usize::from((mask >> start) & 0b11_1111)];
 
-        if present_count == 4 {
-            let missing_mask = window_mask & !mask;
-            let gaps: Vec<u8> = (0..6)
-                .filter(|&i| (missing_mask >> (start + i)) & 1 == 1)
-                .collect();
+        if info.count == 4 {
+            let gaps = info.gaps();
 
             // Both gaps must be internal (not at position 0 or 5)
             if gaps.len() == 2 && gaps[0] > 0 && gaps[1] < 5 {
-                let needed_ranks: Vec<u8> = gaps
-                    .iter()
-                    .map(|&g| {
-                        let bit = start as u8 + g;
-                        if bit == 0 {
-                            14
-                        } else {
-                            bit + 1
-                        }
-                    })
-                    .collect();
+                let needed = gap_ranks(start as u8, gaps);
 
                 // Find all outs
-                let outs: Vec<Card> = FULL_DECK
-                    .iter()
-                    .filter(|c| {
-                        needed_ranks.contains(&c.rank.value())
-                            && !all_cards.contains(c)
-                            && !dead_cards.contains(c)
-                    })
-                    .copied()
-                    .collect();
+                let outs = live[usize::from(needed[0])] | live[usize::from(needed[1])];
 
                 let high_card = if start == 0 { 6 } else { start as u8 + 6 };
                 let is_nut = high_card == 14;
 
-                if !outs.is_empty() {
-                    draws.push(StraightDraw {
+                if outs != 0 {
+                    keep_best(&mut draws, StraightCandidate {
                         draw_type: DrawType::DoubleGutshot,
-                        needed_ranks,
+                        needed,
+                        needed_len: 2,
                         outs,
                         high_card,
                         is_nut,
@@ -394,39 +536,25 @@ fn analyze_straight_draws(
     // Check for backdoor straights (only on flop)
     if board.len() == 3 {
         for start in 0..=9 {
-            let window_mask: u16 = 0b11111 << start;
-            let present = mask & window_mask;
-            let present_count = count_bits(present);
+            let info = &FIVE_WINDOW_INFO[usize::from((mask >> start) & 0b11111)];
 
             // 3 cards with 2 gaps (backdoor)
-            if present_count == 3 {
+            if info.count == 3 {
                 // Check if 3 cards are relatively connected (within 5 span)
-                let missing_mask = window_mask & !mask;
-                let gaps: Vec<u8> = (0..5)
-                    .filter(|&i| (missing_mask >> (start + i)) & 1 == 1)
-                    .collect();
+                let gaps = info.gaps();
 
                 if gaps.len() == 2 {
-                    let needed_ranks: Vec<u8> = gaps
-                        .iter()
-                        .map(|&g| {
-                            let bit = start as u8 + g;
-                            if bit == 0 {
-                                14
-                            } else {
-                                bit + 1
-                            }
-                        })
-                        .collect();
+                    let needed = gap_ranks(start as u8, gaps);
 
                     let high_card = if start == 0 { 5 } else { start as u8 + 5 };
                     let is_nut = high_card == 14;
 
                     // For backdoor, we don't count specific outs (need 2 running cards)
-                    draws.push(StraightDraw {
+                    keep_best(&mut draws, StraightCandidate {
                         draw_type: DrawType::BackdoorStraight,
-                        needed_ranks,
-                        outs: Vec::new(),
+                        needed,
+                        needed_len: 2,
+                        outs: 0,
                         high_card,
                         is_nut,
                     });
@@ -435,21 +563,7 @@ fn analyze_straight_draws(
         }
     }
 
-    // Deduplicate: keep the best draw for each high_card
-    let mut best_draws: HashMap<u8, StraightDraw> = HashMap::new();
-    for draw in draws {
-        let key = draw.high_card;
-        if let Some(existing) = best_draws.get(&key) {
-            // Prefer by: out count desc, then draw type priority
-            if draw.outs.len() > existing.outs.len() {
-                best_draws.insert(key, draw);
-            }
-        } else {
-            best_draws.insert(key, draw);
-        }
-    }
-
-    best_draws.into_values().collect()
+    draws
 }
 
 /// Analyze draws for given hole cards and board
@@ -459,6 +573,55 @@ fn analyze_straight_draws(
 /// - `hole_cards.len() != 2`
 /// - `board.len() > 5`
 pub fn analyze_draws(hole_cards: &[Card], board: &[Card], dead_cards: &[Card]) -> HoldemResult<DrawAnalysis> {
+    analyze_draws_with_dead_mask(hole_cards, board, cards_to_mask(dead_cards))
+}
+
+/// Analyze draws with dead cards given as a card mask (see `cards_to_mask`)
+///
+/// Lets callers that analyze many hands against the same dead cards build the
+/// mask once.
+///
+/// # Errors
+/// Returns an error if:
+/// - `hole_cards.len() != 2`
+/// - `board.len() > 5`
+pub fn analyze_draws_with_dead_mask(
+    hole_cards: &[Card],
+    board: &[Card],
+    dead_mask: u64,
+) -> HoldemResult<DrawAnalysis> {
+    validate_draw_input(hole_cards, board)?;
+    let scan = scan_draws(hole_cards, board, dead_mask);
+    let all_outs: Vec<Card> = mask_to_cards(scan.outs_mask()).collect();
+    let total_outs = all_outs.len();
+
+    Ok(DrawAnalysis {
+        hole_cards: hole_cards.to_vec(),
+        board: board.to_vec(),
+        has_flush: scan.has_flush,
+        has_straight: scan.has_straight,
+        flush_draws: scan.flush.into_iter().flatten().map(FlushDraw::from).collect(),
+        straight_draws: scan.straight.into_iter().flatten().map(StraightDraw::from).collect(),
+        total_outs,
+        all_outs,
+    })
+}
+
+/// Union of every draw's outs as a card mask (see `cards_to_mask`)
+///
+/// Equivalent to the mask of `analyze_draws(..).all_outs`, without building
+/// the per-draw card lists, for callers that only need out counts.
+///
+/// # Errors
+/// Returns an error if:
+/// - `hole_cards.len() != 2`
+/// - `board.len() > 5`
+pub fn draw_outs_mask(hole_cards: &[Card], board: &[Card], dead_mask: u64) -> HoldemResult<u64> {
+    validate_draw_input(hole_cards, board)?;
+    Ok(scan_draws(hole_cards, board, dead_mask).outs_mask())
+}
+
+fn validate_draw_input(hole_cards: &[Card], board: &[Card]) -> HoldemResult<()> {
     if hole_cards.len() != 2 {
         return Err(HoldemError::InvalidCardCount {
             expected: "2",
@@ -468,75 +631,66 @@ pub fn analyze_draws(hole_cards: &[Card], board: &[Card], dead_cards: &[Card]) -
     if board.len() > 5 {
         return Err(HoldemError::BoardTooLarge(board.len()));
     }
+    Ok(())
+}
 
-    let dead_set: HashSet<Card> = dead_cards.iter().copied().collect();
+/// Draws found for one spot, before conversion to the public types
+struct DrawScan {
+    has_flush: bool,
+    has_straight: bool,
+    flush: [Option<FlushCandidate>; 4],
+    straight: [Option<StraightCandidate>; 15],
+}
+
+impl DrawScan {
+    fn outs_mask(&self) -> u64 {
+        let flush = self.flush.iter().flatten().map(|d| d.outs);
+        let straight = self.straight.iter().flatten().map(|d| d.outs);
+        flush.chain(straight).fold(0, |mask, outs| mask | outs)
+    }
+}
+
+/// Run the flush and straight analyzers on validated input
+fn scan_draws(hole_cards: &[Card], board: &[Card], dead_mask: u64) -> DrawScan {
+    // Hole cards followed by board, on the stack
+    let mut buf = [hole_cards[0]; 7];
+    let n = 2 + board.len();
+    buf[..2].copy_from_slice(hole_cards);
+    buf[2..n].copy_from_slice(board);
+    let all_cards = &buf[..n];
+
+    let known = cards_to_mask(all_cards) | (dead_mask & FULL_DECK_MASK);
 
     // Check if already has flush or straight
-    let all_cards: Vec<Card> = hole_cards.iter().chain(board.iter()).copied().collect();
-    let (has_flush, has_straight) = if all_cards.len() >= 5 {
-        let rank = evaluate_hand(&all_cards)?;
-        let flush = matches!(
-            rank.hand_type,
-            HandType::Flush | HandType::StraightFlush | HandType::RoyalFlush
-        );
-        let straight = matches!(
-            rank.hand_type,
-            HandType::Straight | HandType::StraightFlush | HandType::RoyalFlush
-        );
-        (flush, straight)
-    } else {
-        (false, false)
-    };
+    let rank_mask = build_rank_mask(all_cards);
+    let (has_flush, has_straight) = made_flush_straight(all_cards, rank_mask);
 
     // Analyze draws (only if we don't already have the made hand)
-    let flush_draws = if has_flush {
-        Vec::new()
-    } else {
-        analyze_flush_draws(hole_cards, board, &dead_set)
-    };
-
-    let straight_draws = if has_straight {
-        Vec::new()
-    } else {
-        analyze_straight_draws(hole_cards, board, &dead_set)
-    };
-
-    // Collect all unique outs
-    let mut all_outs_set: HashSet<Card> = HashSet::new();
-    for draw in &flush_draws {
-        all_outs_set.extend(draw.outs.iter());
-    }
-    for draw in &straight_draws {
-        all_outs_set.extend(draw.outs.iter());
-    }
-    let all_outs: Vec<Card> = all_outs_set.into_iter().collect();
-    let total_outs = all_outs.len();
-
-    Ok(DrawAnalysis {
-        hole_cards: hole_cards.to_vec(),
-        board: board.to_vec(),
+    DrawScan {
         has_flush,
         has_straight,
-        flush_draws,
-        straight_draws,
-        total_outs,
-        all_outs,
-    })
+        flush: if has_flush {
+            [None; 4]
+        } else {
+            analyze_flush_draws(hole_cards, board, all_cards, known)
+        },
+        straight: if has_straight {
+            [None; 15]
+        } else {
+            analyze_straight_draws(rank_mask, board, known)
+        },
+    }
 }
 
 /// Count flush outs (convenience function)
 ///
+/// To query several counts for the same cards, call `analyze_draws` once and
+/// use the `DrawAnalysis` methods instead.
+///
 /// # Errors
 /// Returns an error if hole_cards or board are invalid.
 pub fn count_flush_outs(hole_cards: &[Card], board: &[Card]) -> HoldemResult<usize> {
-    let analysis = analyze_draws(hole_cards, board, &[])?;
-    Ok(analysis
-        .flush_draws
-        .iter()
-        .filter(|d| d.draw_type() == DrawType::FlushDraw)
-        .map(FlushDraw::out_count)
-        .max()
-        .unwrap_or(0))
+    Ok(analyze_draws(hole_cards, board, &[])?.flush_out_count())
 }
 
 /// Count straight outs (convenience function)
@@ -544,17 +698,7 @@ pub fn count_flush_outs(hole_cards: &[Card], board: &[Card]) -> HoldemResult<usi
 /// # Errors
 /// Returns an error if hole_cards or board are invalid.
 pub fn count_straight_outs(hole_cards: &[Card], board: &[Card]) -> HoldemResult<usize> {
-    let analysis = analyze_draws(hole_cards, board, &[])?;
-    let mut outs: HashSet<Card> = HashSet::new();
-    for draw in &analysis.straight_draws {
-        if matches!(
-            draw.draw_type,
-            DrawType::OpenEnded | DrawType::Gutshot | DrawType::DoubleGutshot
-        ) {
-            outs.extend(draw.outs.iter().copied());
-        }
-    }
-    Ok(outs.len())
+    Ok(analyze_draws(hole_cards, board, &[])?.straight_out_count())
 }
 
 /// Get the primary (strongest) draw type
@@ -562,29 +706,7 @@ pub fn count_straight_outs(hole_cards: &[Card], board: &[Card]) -> HoldemResult<
 /// # Errors
 /// Returns an error if hole_cards or board are invalid.
 pub fn get_primary_draw(hole_cards: &[Card], board: &[Card]) -> HoldemResult<Option<DrawType>> {
-    let analysis = analyze_draws(hole_cards, board, &[])?;
-
-    // Priority: Flush > OESD > Double Gutshot > Gutshot > Backdoor
-    if analysis.flush_draws.iter().any(|d| d.draw_type() == DrawType::FlushDraw) {
-        return Ok(Some(DrawType::FlushDraw));
-    }
-    if analysis.straight_draws.iter().any(|d| d.draw_type == DrawType::OpenEnded) {
-        return Ok(Some(DrawType::OpenEnded));
-    }
-    if analysis.straight_draws.iter().any(|d| d.draw_type == DrawType::DoubleGutshot) {
-        return Ok(Some(DrawType::DoubleGutshot));
-    }
-    if analysis.straight_draws.iter().any(|d| d.draw_type == DrawType::Gutshot) {
-        return Ok(Some(DrawType::Gutshot));
-    }
-    if analysis.flush_draws.iter().any(|d| d.draw_type() == DrawType::BackdoorFlush) {
-        return Ok(Some(DrawType::BackdoorFlush));
-    }
-    if analysis.straight_draws.iter().any(|d| d.draw_type == DrawType::BackdoorStraight) {
-        return Ok(Some(DrawType::BackdoorStraight));
-    }
-
-    Ok(None)
+    Ok(analyze_draws(hole_cards, board, &[])?.primary_draw())
 }
 
 #[cfg(test)]
@@ -662,6 +784,9 @@ mod tests {
 
         assert!(analysis.is_combo_draw());
         assert!(analysis.total_outs > 12); // Should be ~15 outs
+        // 9 hearts + 8 straight outs, minus Th and 5h counted by both
+        assert_eq!(analysis.total_outs, 15);
+        assert!(analysis.all_outs.is_sorted());
     }
 
     #[test]
@@ -686,6 +811,30 @@ mod tests {
         assert!(analysis.straight_draws.is_empty());
     }
 
+    #[test]
+    fn test_made_hands_match_evaluator() {
+        use crate::card::FULL_DECK;
+        use crate::evaluator::{evaluate_hand, HandType};
+        use rand::prelude::*;
+
+        let mut rng = StdRng::seed_from_u64(5);
+        let mut deck = FULL_DECK;
+        for n in [5, 6, 7].repeat(700) {
+            deck.shuffle(&mut rng);
+            let hand = &deck[..n];
+            let hand_type = evaluate_hand(hand).unwrap().hand_type;
+            let expected = (
+                matches!(hand_type, HandType::Flush | HandType::StraightFlush | HandType::RoyalFlush),
+                matches!(hand_type, HandType::Straight | HandType::StraightFlush | HandType::RoyalFlush),
+            );
+            assert_eq!(made_flush_straight(hand, build_rank_mask(hand)), expected, "{hand:?}");
+        }
+
+        // Flush plus an off-suit straight reports only the flush
+        let hand = cards("Ah Kh 7h 4h 2h 3c 5d");
+        assert_eq!(made_flush_straight(&hand, build_rank_mask(&hand)), (true, false));
+    }
+
     #[test]
     fn test_wheel_straight_draw() {
         let hole = cards("Ah 2c");
@@ -709,6 +858,37 @@ mod tests {
         assert!(analysis_with_dead.flush_draws[0].out_count() < analysis_no_dead.flush_draws[0].out_count());
     }
 
+    #[test]
+    fn test_dead_mask_matches_dead_cards() {
+        let hole = cards("Ah 9h");
+        let board = cards("Kh 5h 2c");
+        let dead = cards("Qh Jh");
+
+        let by_cards = analyze_draws(&hole, &board, &dead).unwrap();
+        let by_mask = analyze_draws_with_dead_mask(&hole, &board, cards_to_mask(&dead)).unwrap();
+        assert_eq!(by_mask.all_outs, by_cards.all_outs);
+        assert_eq!(by_mask.flush_out_count(), 7);
+    }
+
+    #[test]
+    fn test_draw_outs_mask_matches_analysis() {
+        for (hole, board) in [
+            ("9h 8h", "7h 6c 2h"),
+            ("Ah 2c", "3d 4s Kh"),
+            ("Th 7c", "8d 5s 2h 3c"),
+            ("Ah 9h", "Kh 5h 2h"),
+            ("Qh 5h", "Tc 6h"),
+        ] {
+            let (hole, board) = (cards(hole), cards(board));
+            let dead = cards("Js");
+            let analysis = analyze_draws(&hole, &board, &dead).unwrap();
+            let mask = draw_outs_mask(&hole, &board, cards_to_mask(&dead)).unwrap();
+            assert_eq!(mask, cards_to_mask(&analysis.all_outs));
+            assert_eq!(mask.count_ones() as usize, analysis.total_outs);
+        }
+        assert!(draw_outs_mask(&cards("Ah"), &[], 0).is_err());
+    }
+
     #[test]
     fn test_get_primary_draw() {
         let hole = cards("9h 8h");
@@ -730,68 +910,40 @@ mod tests {
         // straight_outs is usize, always >= 0
     }
 
-    // Regression tests for is_nut flush draw edge cases
-    #[test]
-    fn test_is_nut_ace_on_board() {
-        // When Ace of flush suit is on board, hero has nut flush draw
-        let hole = cards("Kh 5h");
-        let board = cards("Ah 6h 2c"); // Ah on board, 4 hearts total
-
-        let analysis = analyze_draws(&hole, &board, &[]).unwrap();
-
-        assert_eq!(analysis.flush_draws.len(), 1);
-        assert!(analysis.flush_draws[0].is_nut); // Ace on board means nut
-    }
-
-    #[test]
-    fn test_is_nut_ace_dead() {
-        // When Ace of flush suit is dead, hero has nut flush draw
-        let hole = cards("Kh 5h");
-        let board = cards("Tc 6h 2c");
-        let dead = cards("Ah");
-
-        let analysis = analyze_draws(&hole, &board, &dead).unwrap();
-
-        assert_eq!(analysis.flush_draws.len(), 1);
-        assert!(analysis.flush_draws[0].is_nut); // Ace is dead means nut
-    }
-
     #[test]
-    fn test_is_nut_ace_not_available() {
-        // When Ace is neither held, on board, nor dead, is_nut is False
-        let hole = cards("Kh 5h");
-        let board = cards("Tc 6h 2c");
-
+    fn test_analysis_queries_match_count_functions() {
+        let hole = cards("9h 8h");
+        let board = cards("7h 6c 2h");
         let analysis = analyze_draws(&hole, &board, &[]).unwrap();
 
-        assert_eq!(analysis.flush_draws.len(), 1);
-        assert!(!analysis.flush_draws[0].is_nut); // Ace could be out there
+        assert_eq!(analysis.flush_out_count(), count_flush_outs(&hole, &board).unwrap());
+        assert_eq!(analysis.straight_out_count(), count_straight_outs(&hole, &board).unwrap());
+        assert_eq!(analysis.primary_draw(), get_primary_draw(&hole, &board).unwrap());
+        assert_eq!(analysis.flush_out_count(), 9);
+        assert_eq!(analysis.straight_out_count(), 8);
+        assert_eq!(analysis.primary_draw(), Some(DrawType::FlushDraw));
     }
 
+    // Regression tests for is_nut flush draw edge cases
     #[test]
-    fn test_is_nut_ace_dead_but_king_live() {
-        // When Ace is dead but King is live, hero without King is NOT nut
-        let hole = cards("Qh 5h"); // Hero has Queen high
-        let board = cards("Tc 6h 2c");
-        let dead = cards("Ah"); // Ace dead, but Kh is still live!
-
-        let analysis = analyze_draws(&hole, &board, &dead).unwrap();
-
-        assert_eq!(analysis.flush_draws.len(), 1);
-        assert!(!analysis.flush_draws[0].is_nut); // Kh could beat Qh
-    }
-
-    #[test]
-    fn test_is_nut_ace_and_king_dead() {
-        // When both Ace and King are dead and hero has Queen, hero has nut flush draw
-        let hole = cards("Qh 5h"); // Hero has Queen high
-        let board = cards("Tc 6h 2c");
-        let dead = cards("Ah Kh"); // Both Ace and King dead
-
-        let analysis = analyze_draws(&hole, &board, &dead).unwrap();
-
-        assert_eq!(analysis.flush_draws.len(), 1);
-        assert!(analysis.flush_draws[0].is_nut); // Queen is highest remaining
+    fn test_is_nut_flush_draw() {
+        for (hole, board, dead, is_nut) in [
+            // Ace of the flush suit on board: hero has the nut draw
+            ("Kh 5h", "Ah 6h 2c", "", true),
+            // Ace of the flush suit dead: hero has the nut draw
+            ("Kh 5h", "Tc 6h 2c", "Ah", true),
+            // Ace neither held, on board, nor dead: not the nuts
+            ("Kh 5h", "Tc 6h 2c", "", false),
+            // Ace dead but Kh still live: Queen high is not the nuts
+            ("Qh 5h", "Tc 6h 2c", "Ah", false),
+            // Ace and King both dead: Queen is the highest remaining
+            ("Qh 5h", "Tc 6h 2c", "Ah Kh", true),
+        ] {
+            let analysis = analyze_draws(&cards(hole), &cards(board), &cards(dead)).unwrap();
+
+            assert_eq!(analysis.flush_draws.len(), 1, "{hole} / {board} / {dead}");
+            assert_eq!(analysis.flush_draws[0].is_nut, is_nut, "{hole} / {board} / {dead}");
+        }
     }
 
     // Regression tests for river draw behavior
@@ -830,4 +982,15 @@ mod tests {
             .collect();
         assert!(!double_gs.is_empty());
     }
+
+    #[test]
+    fn test_window_info_tables() {
+        for (pattern, info) in SIX_WINDOW_INFO.iter().enumerate() {
+            assert_eq!(u32::from(info.count), pattern.count_ones());
+            assert_eq!(usize::from(info.count) + info.gaps().len(), 6);
+            assert!(info.gaps().iter().all(|&g| pattern & (1 << g) == 0));
+        }
+        assert_eq!(FIVE_WINDOW_INFO[0b11011].gaps(), &[2]);
+        assert_eq!(FIVE_WINDOW_INFO[0b10101].gaps(), &[1, 3]);
+    }
 }
@@ -3,19 +3,21 @@
 //! Calculates the probability of each player winning a hand by simulating
 //! random runouts multiple times.
 
-use crate::card::{Card, FULL_DECK};
+use crate::card::{cards_to_mask, mask_to_cards, Card, FULL_DECK};
 use crate::error::{HoldemError, HoldemResult};
-use crate::evaluator::find_winners;
-use crate::range::{hands_are_disjoint, CardDistribution, Odometer};
+use crate::evaluator::{evaluate_seven_batch, evaluate_seven_strength, HandStrength};
+use crate::range::{CardDistribution, Odometer};
 use rand::prelude::*;
 use serde::{Deserialize, Serialize};
-use std::collections::HashSet;
 
 // std::time::Instant is not available in WASM, so we skip timing there
 // The WASM binding layer (holdem-wasm) handles timing with js_sys::Date
 #[cfg(not(target_arch = "wasm32"))]
 use std::time::Instant;
 
+#[cfg(all(feature = "parallel", not(target_arch = "wasm32")))]
+use rayon::prelude::*;
+
 /// A player's hole cards
 ///
 /// - If cards is Some: uses the specific 2 cards
@@ -138,25 +140,24 @@ fn validate_equity_request(request: &EquityRequest) -> HoldemResult<()> {
         }
     }
 
-    let mut known_cards: HashSet<Card> = HashSet::new();
-    for &card in &request.board {
-        if !known_cards.insert(card) {
-            return Err(HoldemError::DuplicateCard(card.to_string()));
+    let mut known_mask = 0u64;
+    add_known_cards(&mut known_mask, &request.board)?;
+    add_known_cards(&mut known_mask, &request.dead_cards)?;
+    for player in &request.players {
+        if !player.is_random {
+            add_known_cards(&mut known_mask, &player.cards)?;
         }
     }
-    for &card in &request.dead_cards {
-        if !known_cards.insert(card) {
+    Ok(())
+}
+
+/// Add `cards` to a known-card mask, rejecting any card already in it
+fn add_known_cards(mask: &mut u64, cards: &[Card]) -> HoldemResult<()> {
+    for &card in cards {
+        if *mask & card.bit() != 0 {
             return Err(HoldemError::DuplicateCard(card.to_string()));
         }
-    }
-    for player in &request.players {
-        if !player.is_random {
-            for &card in &player.cards {
-                if !known_cards.insert(card) {
-                    return Err(HoldemError::DuplicateCard(card.to_string()));
-                }
-            }
-        }
+        *mask |= card.bit();
     }
     Ok(())
 }
@@ -227,25 +228,42 @@ impl EquityAccumulator {
         }
     }
 
-    fn record(&mut self, winner_indices: &[usize]) {
+    /// Record one simulation from the players' hand strengths
+    ///
+    /// Fuses winner selection with accumulation: the players holding the best
+    /// strength win (or split) without building a winner list.
+    fn record(&mut self, strengths: &[HandStrength]) {
         self.total += 1;
 
-        if winner_indices.len() == 1 {
-            // Single winner
-            let winner = winner_indices[0];
+        let best = strengths.iter().copied().max().unwrap_or_default();
+        let num_winners = strengths.iter().filter(|&&s| s == best).count();
+        if num_winners == 1 {
+            let winner = strengths.iter().position(|&s| s == best).unwrap_or_default();
             self.wins[winner] += 1;
             self.equity_sum[winner] += 1.0;
         } else {
-            // Tie - split equity
-            let share = 1.0 / winner_indices.len() as f64;
-            for &idx in winner_indices {
-                self.ties[idx] += 1;
-                self.equity_sum[idx] += share;
+            let share = 1.0 / num_winners as f64;
+            for (i, &s) in strengths.iter().enumerate() {
+                if s == best {
+                    self.ties[i] += 1;
+                    self.equity_sum[i] += share;
+                }
             }
         }
     }
 
+    /// Add another accumulator's simulations to this one
+    fn merge(&mut self, other: &Self) {
+        self.total += other.total;
+        for i in 0..self.num_players {
+            self.wins[i] += other.wins[i];
+            self.ties[i] += other.ties[i];
+            self.equity_sum[i] += other.equity_sum[i];
+        }
+    }
+
     fn into_results(self, hand_descriptions: Vec<String>, elapsed_ms: f64) -> EquityResult {
+        let mut hand_descriptions = hand_descriptions.into_iter();
         let players: Vec<PlayerEquity> = (0..self.num_players)
             .map(|i| {
                 let win_rate = if self.total > 0 {
@@ -272,7 +290,7 @@ impl EquityAccumulator {
                     win_rate,
                     tie_rate,
                     equity,
-                    hand_description: hand_descriptions.get(i).cloned().unwrap_or_default(),
+                    hand_description: hand_descriptions.next().unwrap_or_default(),
                     combos: 1, // Single hand, not range
                 }
             })
@@ -286,6 +304,73 @@ impl EquityAccumulator {
     }
 }
 
+/// Simulations dealt per evaluation batch in `simulate_batched`
+const SIM_BATCH: usize = 1024;
+
+/// Simulations per independently seeded chunk in `calculate_equity` and
+/// `equity_vs_random`
+const SIM_CHUNK: u32 = 4096;
+
+/// Monte Carlo kernel shared by `calculate_equity` and the range engine
+///
+/// `hands` is the template deal, one 7-card buffer per player as [hole cards,
+/// known board, runout slots]. Each simulation deals hole cards to
+/// `random_players`, then `cards_needed_board` runout cards, from a partial
+/// shuffle of `deck`.
+/// Simulations are dealt in batches of `SIM_BATCH` rows, and each batch is
+/// scored with `evaluate_seven_batch` and recorded into `acc`.
+fn simulate_batched(
+    acc: &mut EquityAccumulator,
+    hands: &[[Card; 7]],
+    random_players: &[usize],
+    cards_needed_board: usize,
+    deck: &mut [Card],
+    num_simulations: usize,
+    rng: &mut SmallRng,
+) {
+    let num_players = hands.len();
+    let board_start = 7 - cards_needed_board;
+    let cards_to_deal = 2 * random_players.len() + cards_needed_board;
+
+    // Every batch row starts as a copy of `hands`; trials then overwrite only
+    // the random players' hole cards and the runout in place.
+    let mut batch: Vec<[Card; 7]> = Vec::with_capacity(num_simulations.min(SIM_BATCH) * num_players);
+    for _ in 0..num_simulations.min(SIM_BATCH) {
+        batch.extend_from_slice(hands);
+    }
+    let mut sims_left = num_simulations;
+
+    while sims_left > 0 {
+        let batch_sims = sims_left.min(SIM_BATCH);
+        batch.truncate(batch_sims * num_players);
+
+        for row in batch.chunks_exact_mut(num_players) {
+            // Shuffle only the cards this simulation deals
+            let (dealt, _) = deck.partial_shuffle(rng, cards_to_deal);
+
+            // Deal cards to random players first
+            let mut deck_idx = 0;
+            for &i in random_players {
+                row[i][..2].copy_from_slice(&dealt[deck_idx..deck_idx + 2]);
+                deck_idx += 2;
+            }
+
+            // Deal community cards into every hand
+            let runout = &dealt[deck_idx..deck_idx + cards_needed_board];
+            for hand in row {
+                hand[board_start..].copy_from_slice(runout);
+            }
+        }
+
+        let strengths = evaluate_seven_batch(&batch);
+        for row in strengths.chunks_exact(num_players) {
+            acc.record(row);
+        }
+
+        sims_left -= batch_sims;
+    }
+}
+
 /// Calculate equity for all players
 ///
 /// Supports both known hands and random players. Random players have their
@@ -303,50 +388,21 @@ pub fn calculate_equity(request: &EquityRequest) -> HoldemResult<EquityResult> {
     #[cfg(not(target_arch = "wasm32"))]
     let start = Instant::now();
 
-    // Identify random vs known players
-    let random_player_indices: Vec<usize> = request
+    // Mask of all known cards (board + known player hands + dead cards)
+    let known_mask = request
         .players
         .iter()
-        .enumerate()
-        .filter(|(_, p)| p.is_random)
-        .map(|(i, _)| i)
-        .collect();
-
-    // Collect all known cards (board + known player hands + dead cards)
-    let mut known_cards: HashSet<Card> = HashSet::new();
-    for player in &request.players {
-        if !player.is_random {
-            for &card in &player.cards {
-                known_cards.insert(card);
-            }
-        }
-    }
-    for &card in &request.board {
-        known_cards.insert(card);
-    }
-    for &card in &request.dead_cards {
-        known_cards.insert(card);
-    }
+        .filter(|p| !p.is_random)
+        .fold(cards_to_mask(&request.board) | cards_to_mask(&request.dead_cards), |mask, p| {
+            mask | cards_to_mask(&p.cards)
+        });
 
-    // Build remaining deck
-    let remaining: Vec<Card> = FULL_DECK
-        .iter()
-        .filter(|c| !known_cards.contains(c))
-        .copied()
-        .collect();
+    // Build remaining deck (cards are 1-byte indices, in deck order)
+    let remaining: Vec<Card> = mask_to_cards(!known_mask).collect();
 
     let cards_needed_board = 5 - request.board.len();
     let num_players = request.players.len();
 
-    // Initialize RNG
-    let mut rng = match request.seed {
-        Some(seed) => StdRng::seed_from_u64(seed),
-        None => StdRng::from_os_rng(),
-    };
-
-    // Initialize accumulator
-    let mut acc = EquityAccumulator::new(num_players);
-
     // Hand descriptions
     let hand_descriptions: Vec<String> = request
         .players
@@ -355,58 +411,61 @@ pub fn calculate_equity(request: &EquityRequest) -> HoldemResult<EquityResult> {
             if p.is_random {
                 "(Random)".to_string()
             } else {
-                p.cards
-                    .iter()
-                    .map(ToString::to_string)
-                    .collect::<Vec<_>>()
-                    .join(" ")
+                // Validated above: exactly two hole cards
+                format!("{} {}", p.cards[0], p.cards[1])
             }
         })
         .collect();
 
-    // Run simulations
-    let mut deck_remaining = remaining.clone();
-
-    for _ in 0..request.num_simulations {
-        // Shuffle remaining deck
-        deck_remaining.shuffle(&mut rng);
-
-        // Deal cards to random players first
-        let mut deck_idx = 0;
-        let mut sim_hole_cards: Vec<Vec<Card>> = Vec::with_capacity(num_players);
-
-        for (i, player) in request.players.iter().enumerate() {
-            if random_player_indices.contains(&i) {
-                // Random player: deal from shuffled deck
-                sim_hole_cards.push(vec![deck_remaining[deck_idx], deck_remaining[deck_idx + 1]]);
-                deck_idx += 2;
-            } else {
-                // Known player: use their cards
-                sim_hole_cards.push(player.cards.clone());
+    // Hand buffers are built once as [hole cards, known board, runout]; each
+    // simulation only overwrites the random players' hole cards and the runout.
+    let board_start = 2 + request.board.len();
+    let hands: Vec<[Card; 7]> = request
+        .players
+        .iter()
+        .map(|player| {
+            let mut hand = [FULL_DECK[0]; 7];
+            if !player.is_random {
+                hand[..2].copy_from_slice(&player.cards);
             }
-        }
-
-        // Deal community cards
-        let runout: Vec<Card> = deck_remaining[deck_idx..deck_idx + cards_needed_board].to_vec();
-
-        // Build complete board
-        let mut full_board = request.board.clone();
-        full_board.extend(runout);
+            hand[2..board_start].copy_from_slice(&request.board);
+            hand
+        })
+        .collect();
 
-        // Build complete hands for each player
-        let hands: Vec<Vec<Card>> = sim_hole_cards
-            .into_iter()
-            .map(|mut hole| {
-                hole.extend(full_board.iter().copied());
-                hole
-            })
-            .collect();
+    let random_players: Vec<usize> = (0..num_players).filter(|&i| request.players[i].is_random).collect();
+
+    // Simulations run in fixed-size chunks, each with its own deck, RNG
+    // stream (seeded from `seed` + chunk index) and accumulator, so results
+    // do not depend on whether the chunks run in parallel.
+    let base_seed = request.seed.unwrap_or_else(|| SmallRng::from_os_rng().next_u64());
+    let run_chunk = |chunk: u32| {
+        let mut rng = SmallRng::seed_from_u64(base_seed.wrapping_add(u64::from(chunk)));
+        let sims = (request.num_simulations - chunk * SIM_CHUNK).min(SIM_CHUNK);
+        let mut acc = EquityAccumulator::new(num_players);
+        let mut deck = remaining.clone();
+        simulate_batched(
+            &mut acc,
+            &hands,
+            &random_players,
+            cards_needed_board,
+            &mut deck,
+            sims as usize,
+            &mut rng,
+        );
+        acc
+    };
+    let num_chunks = request.num_simulations.div_ceil(SIM_CHUNK);
 
-        // Find winners (unwrap is safe here - we always have 7-card hands)
-        let winners = find_winners(&hands).unwrap();
+    #[cfg(all(feature = "parallel", not(target_arch = "wasm32")))]
+    let chunks: Vec<EquityAccumulator> = (0..num_chunks).into_par_iter().map(run_chunk).collect();
+    #[cfg(not(all(feature = "parallel", not(target_arch = "wasm32"))))]
+    let chunks: Vec<EquityAccumulator> = (0..num_chunks).map(run_chunk).collect();
 
-        // Record result
-        acc.record(&winners);
+    // Merged in chunk order so the totals are reproducible
+    let mut acc = EquityAccumulator::new(num_players);
+    for chunk in &chunks {
+        acc.merge(chunk);
     }
 
     #[cfg(not(target_arch = "wasm32"))]
@@ -652,17 +711,9 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
     let num_players = request.players.len();
 
     // Build base excluded cards (board + dead) with duplicate detection
-    let mut base_excluded: HashSet<Card> = HashSet::new();
-    for &card in &request.board {
-        if !base_excluded.insert(card) {
-            return Err(HoldemError::DuplicateCard(card.to_string()));
-        }
-    }
-    for &card in &request.dead_cards {
-        if !base_excluded.insert(card) {
-            return Err(HoldemError::DuplicateCard(card.to_string()));
-        }
-    }
+    let mut base_excluded = 0u64;
+    add_known_cards(&mut base_excluded, &request.board)?;
+    add_known_cards(&mut base_excluded, &request.dead_cards)?;
 
     // Build distributions for each player
     let mut distributions: Vec<Vec<(Card, Card)>> = Vec::with_capacity(num_players);
@@ -676,10 +727,10 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
                 if c1 == c2 {
                     return Err(HoldemError::DuplicateCard(c1.to_string()));
                 }
-                if base_excluded.contains(c1) {
+                if base_excluded & c1.bit() != 0 {
                     return Err(HoldemError::DuplicateCard(c1.to_string()));
                 }
-                if base_excluded.contains(c2) {
+                if base_excluded & c2.bit() != 0 {
                     return Err(HoldemError::DuplicateCard(c2.to_string()));
                 }
                 distributions.push(vec![(*c1, *c2)]);
@@ -694,7 +745,7 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
             }
             RangePlayer::Range(dist) => {
                 // Filter by base excluded cards
-                let filtered = dist.filter_excluding(&base_excluded);
+                let filtered = dist.filter_excluding_mask(base_excluded);
                 hand_descriptions.push(format!("{} combos", filtered.len()));
                 combo_counts.push(filtered.len());
                 distributions.push(filtered.hands().to_vec());
@@ -713,33 +764,28 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
     }
 
     // Validate that multiple Specific players don't have conflicting cards
-    let mut specific_cards: HashSet<Card> = HashSet::new();
+    let mut specific_cards = 0u64;
     for player in &request.players {
         if let RangePlayer::Specific(c1, c2) = player {
-            if !specific_cards.insert(*c1) {
-                return Err(HoldemError::DuplicateCard(c1.to_string()));
-            }
-            if !specific_cards.insert(*c2) {
-                return Err(HoldemError::DuplicateCard(c2.to_string()));
-            }
+            add_known_cards(&mut specific_cards, &[*c1, *c2])?;
         }
     }
 
-    // Identify random players
-    let random_player_indices: Vec<usize> = request
+    // Identify random players: a per-seat flag for lookups by seat, and the
+    // seat list the simulation kernel deals to
+    let is_random: Vec<bool> = request
         .players
         .iter()
-        .enumerate()
-        .filter(|(_, p)| matches!(p, RangePlayer::Random))
-        .map(|(i, _)| i)
+        .map(|p| matches!(p, RangePlayer::Random))
         .collect();
+    let random_player_indices: Vec<usize> = (0..num_players).filter(|&i| is_random[i]).collect();
 
     // Build odometer extents (use 1 for random players)
     let extents: Vec<usize> = distributions
         .iter()
-        .enumerate()
-        .map(|(i, d)| {
-            if random_player_indices.contains(&i) {
+        .zip(&is_random)
+        .map(|(d, &random)| {
+            if random {
                 1 // Random players have single "virtual" combo
             } else {
                 d.len()
@@ -769,118 +815,70 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
 
     // Initialize RNG
     let mut rng = match request.seed {
-        Some(seed) => StdRng::seed_from_u64(seed),
-        None => StdRng::from_os_rng(),
+        Some(seed) => SmallRng::seed_from_u64(seed),
+        None => SmallRng::from_os_rng(),
     };
 
     let cards_needed_board = 5 - request.board.len();
 
-    // Helper to check if a combination is valid (no card conflicts)
-    let is_valid_combination = |indices: &[usize]| -> Option<(Vec<(Card, Card)>, Vec<Card>)> {
+    // Helper to check if a combination is valid (no card conflicts). Returns
+    // each seat's hole cards (a placeholder for random players) and the mask
+    // of every card the combination and the board/dead cards use.
+    let is_valid_combination = |indices: &[usize]| -> Option<(Vec<(Card, Card)>, u64)> {
+        let placeholder = FULL_DECK[0];
         let mut current_hands: Vec<(Card, Card)> = Vec::with_capacity(num_players);
+        let mut all_used = base_excluded;
 
         for (player_idx, &combo_idx) in indices.iter().enumerate() {
-            if random_player_indices.contains(&player_idx) {
-                // Random player - use placeholder
-                let placeholder = Card::from_index(0).unwrap();
+            if is_random[player_idx] {
                 current_hands.push((placeholder, placeholder));
-            } else {
-                current_hands.push(distributions[player_idx][combo_idx]);
+                continue;
             }
-        }
-
-        // Check for card conflicts (only for non-random players)
-        let non_random_hands: Vec<(Card, Card)> = current_hands
-            .iter()
-            .enumerate()
-            .filter(|(i, _)| !random_player_indices.contains(i))
-            .map(|(_, h)| *h)
-            .collect();
 
-        if !hands_are_disjoint(&non_random_hands) {
-            return None;
-        }
-
-        // Also check against board/dead cards
-        let mut all_used = base_excluded.clone();
-        for &(c1, c2) in &non_random_hands {
-            if all_used.contains(&c1) || all_used.contains(&c2) {
+            // Conflicts with board/dead cards or an earlier player's hand
+            let (c1, c2) = distributions[player_idx][combo_idx];
+            let hand_mask = c1.bit() | c2.bit();
+            if c1 == c2 || all_used & hand_mask != 0 {
                 return None;
             }
-            all_used.insert(c1);
-            all_used.insert(c2);
+            all_used |= hand_mask;
+            current_hands.push((c1, c2));
         }
 
-        // Build remaining deck for this combination
-        let remaining: Vec<Card> = FULL_DECK
-            .iter()
-            .filter(|c| !all_used.contains(c))
-            .copied()
-            .collect();
-
-        Some((current_hands, remaining))
+        Some((current_hands, all_used))
     };
 
     // Helper to run simulation for a combination
     let run_simulation = |current_hands: &[(Card, Card)],
-                          remaining: &[Card],
-                          rng: &mut StdRng|
-     -> (Vec<u64>, Vec<u64>, Vec<f64>) {
-        let mut combo_wins = vec![0u64; num_players];
-        let mut combo_ties = vec![0u64; num_players];
-        let mut combo_equity = vec![0.0f64; num_players];
-        let mut deck_remaining = remaining.to_vec();
-
-        for _ in 0..sims_per_combo {
-            deck_remaining.shuffle(rng);
-
-            let mut deck_idx = 0;
-            let mut sim_hole_cards: Vec<Vec<Card>> = Vec::with_capacity(num_players);
-
-            for (i, &(c1, c2)) in current_hands.iter().enumerate() {
-                if random_player_indices.contains(&i) {
-                    // Deal random cards
-                    sim_hole_cards.push(vec![deck_remaining[deck_idx], deck_remaining[deck_idx + 1]]);
-                    deck_idx += 2;
-                } else {
-                    sim_hole_cards.push(vec![c1, c2]);
-                }
-            }
-
-            // Deal community cards
-            let runout: Vec<Card> = deck_remaining[deck_idx..deck_idx + cards_needed_board].to_vec();
-
-            // Build complete board
-            let mut full_board = request.board.clone();
-            full_board.extend(runout);
-
-            // Build complete hands
-            let hands: Vec<Vec<Card>> = sim_hole_cards
-                .into_iter()
-                .map(|mut hole| {
-                    hole.extend(full_board.iter().copied());
-                    hole
-                })
-                .collect();
-
-            // Find winners
-            let winners = find_winners(&hands).unwrap();
-
-            // Record results
-            if winners.len() == 1 {
-                let winner = winners[0];
-                combo_wins[winner] += 1;
-                combo_equity[winner] += 1.0;
-            } else {
-                let share = 1.0 / winners.len() as f64;
-                for &idx in &winners {
-                    combo_ties[idx] += 1;
-                    combo_equity[idx] += share;
-                }
-            }
-        }
+                          used_mask: u64,
+                          rng: &mut SmallRng|
+     -> EquityAccumulator {
+        let mut acc = EquityAccumulator::new(num_players);
+        let mut deck_remaining: Vec<Card> = mask_to_cards(!used_mask).collect();
+
+        // Hand buffers are built once per combination as [hole cards, known
+        // board, runout]; each simulation overwrites random holes and the runout.
+        let board_start = 2 + request.board.len();
+        let hands: Vec<[Card; 7]> = current_hands
+            .iter()
+            .map(|&(c1, c2)| {
+                let mut hand = [c1; 7];
+                hand[1] = c2;
+                hand[2..board_start].copy_from_slice(&request.board);
+                hand
+            })
+            .collect();
 
-        (combo_wins, combo_ties, combo_equity)
+        simulate_batched(
+            &mut acc,
+            &hands,
+            &random_player_indices,
+            cards_needed_board,
+            &mut deck_remaining,
+            sims_per_combo as usize,
+            rng,
+        );
+        acc
     };
 
     match strategy {
@@ -889,13 +887,12 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
             // EXHAUSTIVE MODE: Process all combinations inline
             // =================================================================
 
-            let odometer = Odometer::new(extents);
-            for indices in odometer {
-                if let Some((current_hands, remaining)) = is_valid_combination(&indices) {
+            let mut odometer = Odometer::new(extents);
+            while let Some(indices) = odometer.advance() {
+                if let Some((current_hands, used_mask)) = is_valid_combination(indices) {
                     total_combinations += 1;
 
-                    let (combo_wins, combo_ties, combo_equity) =
-                        run_simulation(&current_hands, &remaining, &mut rng);
+                    let combo = run_simulation(&current_hands, used_mask, &mut rng);
 
                     total_simulations += sims_per_combo as u64;
 
@@ -904,9 +901,9 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
 
                     for i in 0..num_players {
                         let sim_count = sims_per_combo as f64;
-                        total_equity[i] += (combo_equity[i] / sim_count) * weight;
-                        total_wins[i] += (combo_wins[i] as f64 / sim_count) * weight;
-                        total_ties[i] += (combo_ties[i] as f64 / sim_count) * weight;
+                        total_equity[i] += (combo.equity_sum[i] / sim_count) * weight;
+                        total_wins[i] += (combo.wins[i] as f64 / sim_count) * weight;
+                        total_ties[i] += (combo.ties[i] as f64 / sim_count) * weight;
                     }
                 }
             }
@@ -920,24 +917,24 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
             // selected, regardless of its position in the odometer iteration.
             // Trade-off: Must iterate all combinations, slower for huge ranges.
 
-            let mut reservoir: Vec<(Vec<(Card, Card)>, Vec<Card>)> =
+            let mut reservoir: Vec<(Vec<(Card, Card)>, u64)> =
                 Vec::with_capacity(max_combos);
             let mut valid_count: usize = 0;
 
             // Phase 1: Collect samples using reservoir sampling (Algorithm R)
-            let odometer = Odometer::new(extents.clone());
-            for indices in odometer {
-                if let Some((hands, remaining)) = is_valid_combination(&indices) {
+            let mut odometer = Odometer::new(extents.clone());
+            while let Some(indices) = odometer.advance() {
+                if let Some((hands, used_mask)) = is_valid_combination(indices) {
                     valid_count += 1;
 
                     if reservoir.len() < max_combos {
                         // Fill the reservoir with first k valid combinations
-                        reservoir.push((hands, remaining));
+                        reservoir.push((hands, used_mask));
                     } else {
                         // Reservoir sampling: replace element j with probability k/n
                         let j = rng.random_range(0..valid_count);
                         if j < max_combos {
-                            reservoir[j] = (hands, remaining);
+                            reservoir[j] = (hands, used_mask);
                         }
                     }
                 }
@@ -946,9 +943,8 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
             total_combinations = valid_count as u64;
 
             // Phase 2: Run simulations on reservoir samples
-            for (hands, remaining) in &reservoir {
-                let (combo_wins, combo_ties, combo_equity) =
-                    run_simulation(hands, remaining, &mut rng);
+            for (hands, used_mask) in &reservoir {
+                let combo = run_simulation(hands, *used_mask, &mut rng);
 
                 total_simulations += sims_per_combo as u64;
 
@@ -957,9 +953,9 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
 
                 for i in 0..num_players {
                     let sim_count = sims_per_combo as f64;
-                    total_equity[i] += (combo_equity[i] / sim_count) * weight;
-                    total_wins[i] += (combo_wins[i] as f64 / sim_count) * weight;
-                    total_ties[i] += (combo_ties[i] as f64 / sim_count) * weight;
+                    total_equity[i] += (combo.equity_sum[i] / sim_count) * weight;
+                    total_wins[i] += (combo.wins[i] as f64 / sim_count) * weight;
+                    total_ties[i] += (combo.ties[i] as f64 / sim_count) * weight;
                 }
             }
         }
@@ -975,8 +971,8 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
             let sample_rate = max_combos as f64 / total_theoretical_combos as f64;
             let mut sampled_count: usize = 0;
 
-            let odometer = Odometer::new(extents);
-            for indices in odometer {
+            let mut odometer = Odometer::new(extents);
+            while let Some(indices) = odometer.advance() {
                 // Early exit once we have enough samples
                 if sampled_count >= max_combos {
                     break;
@@ -987,12 +983,11 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
                     continue;
                 }
 
-                if let Some((current_hands, remaining)) = is_valid_combination(&indices) {
+                if let Some((current_hands, used_mask)) = is_valid_combination(indices) {
                     total_combinations += 1;
                     sampled_count += 1;
 
-                    let (combo_wins, combo_ties, combo_equity) =
-                        run_simulation(&current_hands, &remaining, &mut rng);
+                    let combo = run_simulation(&current_hands, used_mask, &mut rng);
 
                     total_simulations += sims_per_combo as u64;
 
@@ -1001,9 +996,9 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
 
                     for i in 0..num_players {
                         let sim_count = sims_per_combo as f64;
-                        total_equity[i] += (combo_equity[i] / sim_count) * weight;
-                        total_wins[i] += (combo_wins[i] as f64 / sim_count) * weight;
-                        total_ties[i] += (combo_ties[i] as f64 / sim_count) * weight;
+                        total_equity[i] += (combo.equity_sum[i] / sim_count) * weight;
+                        total_wins[i] += (combo.wins[i] as f64 / sim_count) * weight;
+                        total_ties[i] += (combo.ties[i] as f64 / sim_count) * weight;
                     }
                 }
             }
@@ -1021,8 +1016,10 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
     let elapsed_ms = 0.0;
 
     // Normalize results
-    let players: Vec<RangePlayerEquity> = (0..num_players)
-        .map(|i| {
+    let players: Vec<RangePlayerEquity> = hand_descriptions
+        .into_iter()
+        .enumerate()
+        .map(|(i, hand_description)| {
             let equity = if total_weight > 0.0 {
                 total_equity[i] / total_weight
             } else {
@@ -1045,7 +1042,7 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
                 win_rate,
                 tie_rate,
                 combos: combo_counts[i],
-                hand_description: hand_descriptions[i].clone(),
+                hand_description,
             }
         })
         .collect();
@@ -1063,6 +1060,8 @@ pub fn calculate_equity_with_ranges(request: &RangeEquityRequest) -> HoldemResul
 /// # Errors
 /// Returns an error if:
 /// - `hole_cards.len() != 2`
+/// - More than 5 board cards
+/// - Duplicate cards detected
 /// - `num_opponents < 1`
 pub fn equity_vs_random(
     hole_cards: &[Card],
@@ -1077,82 +1076,108 @@ pub fn equity_vs_random(
             got: hole_cards.len(),
         });
     }
+    if board.len() > 5 {
+        return Err(HoldemError::BoardTooLarge(board.len()));
+    }
     if num_opponents < 1 {
         return Err(HoldemError::NotEnoughOpponents(1));
     }
 
-    // Collect known cards
-    let mut known_cards: HashSet<Card> = HashSet::new();
-    for &card in hole_cards {
-        known_cards.insert(card);
-    }
-    for &card in board {
-        known_cards.insert(card);
-    }
+    // Build remaining deck from the mask of known cards; the evaluator
+    // kernel expects distinct cards
+    let mut known_mask = 0u64;
+    add_known_cards(&mut known_mask, hole_cards)?;
+    add_known_cards(&mut known_mask, board)?;
+    let remaining: Vec<Card> = mask_to_cards(!known_mask).collect();
+
+    // Simulations run in fixed-size chunks, each with its own RNG stream
+    // seeded from `seed` + chunk index, so results do not depend on whether
+    // the chunks run in parallel.
+    let base_seed = seed.unwrap_or_else(|| SmallRng::from_os_rng().next_u64());
+    let run_chunk = |chunk: u32| {
+        let mut rng = SmallRng::seed_from_u64(base_seed.wrapping_add(u64::from(chunk)));
+        let sims = (num_simulations - chunk * SIM_CHUNK).min(SIM_CHUNK);
+        equity_vs_random_chunk(hole_cards, board, &remaining, num_opponents, sims, &mut rng)
+    };
+    let num_chunks = num_simulations.div_ceil(SIM_CHUNK);
 
-    // Build remaining deck
-    let remaining: Vec<Card> = FULL_DECK
-        .iter()
-        .filter(|c| !known_cards.contains(c))
-        .copied()
-        .collect();
+    #[cfg(all(feature = "parallel", not(target_arch = "wasm32")))]
+    let chunk_sums: Vec<f64> = (0..num_chunks).into_par_iter().map(run_chunk).collect();
+    #[cfg(not(all(feature = "parallel", not(target_arch = "wasm32"))))]
+    let chunk_sums: Vec<f64> = (0..num_chunks).map(run_chunk).collect();
+
+    // Summed in chunk order so the total is reproducible
+    let equity_sum: f64 = chunk_sums.iter().sum();
 
+    Ok(equity_sum / num_simulations as f64)
+}
+
+/// Run `num_simulations` deals for `equity_vs_random`, returning hero's
+/// summed pot share
+fn equity_vs_random_chunk(
+    hole_cards: &[Card],
+    board: &[Card],
+    remaining: &[Card],
+    num_opponents: usize,
+    num_simulations: u32,
+    rng: &mut SmallRng,
+) -> f64 {
     let cards_needed_board = 5 - board.len();
 
-    // Initialize RNG
-    let mut rng = match seed {
-        Some(s) => StdRng::seed_from_u64(s),
-        None => StdRng::from_os_rng(),
-    };
+    // Hand buffers are built once as [hole cards, known board, runout]; hero
+    // is hand 0. Each simulation overwrites opponent hole cards and the runout.
+    let board_start = 2 + board.len();
+    let mut hands: Vec<[Card; 7]> = (0..=num_opponents)
+        .map(|i| {
+            let mut hand = [FULL_DECK[0]; 7];
+            if i == 0 {
+                hand[..2].copy_from_slice(hole_cards);
+            }
+            hand[2..board_start].copy_from_slice(board);
+            hand
+        })
+        .collect();
 
     let mut equity_sum = 0.0;
-    let mut deck_remaining = remaining.clone();
+    let cards_to_deal = cards_needed_board + 2 * num_opponents;
+    let mut deck_remaining = remaining.to_vec();
 
     for _ in 0..num_simulations {
-        deck_remaining.shuffle(&mut rng);
-
-        let mut idx = 0;
-
-        // Deal runout
-        let runout: Vec<Card> = deck_remaining[idx..idx + cards_needed_board].to_vec();
-        idx += cards_needed_board;
-
-        // Deal opponent hands
-        let mut opponent_hands: Vec<Vec<Card>> = Vec::with_capacity(num_opponents);
-        for _ in 0..num_opponents {
-            opponent_hands.push(deck_remaining[idx..idx + 2].to_vec());
+        // Shuffle only the cards this simulation deals
+        let (dealt, _) = deck_remaining.partial_shuffle(rng, cards_to_deal);
+
+        // Deal runout, then opponent hands
+        let runout = &dealt[..cards_needed_board];
+        let mut idx = cards_needed_board;
+        for hand in &mut hands[1..] {
+            hand[..2].copy_from_slice(&dealt[idx..idx + 2]);
             idx += 2;
         }
-
-        // Build complete board
-        let mut full_board = board.to_vec();
-        full_board.extend(runout);
-
-        // Build all hands
-        let mut hands: Vec<Vec<Card>> = Vec::with_capacity(num_opponents + 1);
-
-        // Hero's hand
-        let mut hero_hand = hole_cards.to_vec();
-        hero_hand.extend(full_board.iter().copied());
-        hands.push(hero_hand);
-
-        // Opponent hands
-        for opp in opponent_hands {
-            let mut hand = opp;
-            hand.extend(full_board.iter().copied());
-            hands.push(hand);
+        for hand in &mut hands {
+            hand[board_start..].copy_from_slice(runout);
         }
 
-        // Find winners (unwrap is safe here - we always have 7-card hands)
-        let winners = find_winners(&hands).unwrap();
-
-        // Check if hero (index 0) won
-        if winners.contains(&0) {
-            equity_sum += 1.0 / winners.len() as f64;
+        // Only hero's result matters: stop at the first opponent that beats
+        // hero, otherwise split the pot with every opponent that ties
+        let hero = evaluate_seven_strength(&hands[0]);
+        let mut tied = 1u32;
+        let mut beaten = false;
+        for hand in &hands[1..] {
+            let strength = evaluate_seven_strength(hand);
+            if strength > hero {
+                beaten = true;
+                break;
+            }
+            if strength == hero {
+                tied += 1;
+            }
+        }
+        if !beaten {
+            equity_sum += 1.0 / f64::from(tied);
         }
     }
 
-    Ok(equity_sum / num_simulations as f64)
+    equity_sum
 }
 
 #[cfg(test)]
@@ -1253,6 +1278,31 @@ mod tests {
         assert!(equity < 0.90);
     }
 
+    #[test]
+    fn test_equity_vs_random_deterministic_with_seed() {
+        // Spans several chunks, including a partial last one
+        let hole = cards("Kh Qh");
+        let board = cards("Jh 2c 7h");
+        let a = equity_vs_random(&hole, &board, 2, 10_000, Some(7)).unwrap();
+        let b = equity_vs_random(&hole, &board, 2, 10_000, Some(7)).unwrap();
+        assert_eq!(a, b);
+    }
+
+    #[test]
+    fn test_equity_vs_random_rejects_invalid_input() {
+        let hole = cards("As Ks");
+        for board in ["2d 2d 3c", "As 2d 3c"] {
+            assert!(matches!(
+                equity_vs_random(&hole, &cards(board), 2, 2000, Some(1)),
+                Err(HoldemError::DuplicateCard(_))
+            ));
+        }
+        assert!(matches!(
+            equity_vs_random(&hole, &cards("2d 3c 4h 5s 6d 7c"), 1, 2000, Some(1)),
+            Err(HoldemError::BoardTooLarge(6))
+        ));
+    }
+
     #[test]
     fn test_equity_vs_multiple_random() {
         let hole = cards("Ah As");
@@ -1287,7 +1337,8 @@ mod tests {
         // AK should have ~62-65% equity vs random
         assert!(result.players[0].equity > 0.55);
         assert!(result.players[0].equity < 0.70);
-        // Random player hand description
+        // Hand descriptions
+        assert_eq!(result.players[0].hand_description, "As Kd");
         assert_eq!(result.players[1].hand_description, "(Random)");
     }
 
@@ -2,13 +2,15 @@
 //!
 //! Evaluates 5-7 card hands and determines the best 5-card combination.
 
-use crate::card::{Card, Rank};
+use crate::card::{cards_to_mask, Card, Rank};
 use crate::error::{HoldemError, HoldemResult};
-use itertools::Itertools;
 use serde::{Deserialize, Serialize};
 use std::cmp::Ordering;
-use std::collections::HashMap;
 use std::fmt;
+use std::sync::OnceLock;
+
+#[cfg(all(feature = "parallel", not(target_arch = "wasm32")))]
+use rayon::prelude::*;
 
 /// Poker hand types in ascending strength order
 #[repr(u8)]
@@ -27,6 +29,20 @@ pub enum HandType {
 }
 
 impl HandType {
+    /// All hand types in ascending strength order (index = discriminant)
+    pub const ALL: [HandType; 10] = [
+        HandType::HighCard,
+        HandType::OnePair,
+        HandType::TwoPair,
+        HandType::ThreeOfAKind,
+        HandType::Straight,
+        HandType::Flush,
+        HandType::FullHouse,
+        HandType::FourOfAKind,
+        HandType::StraightFlush,
+        HandType::RoyalFlush,
+    ];
+
     /// Get human-readable name
     #[must_use]
     pub const fn name(self) -> &'static str {
@@ -47,10 +63,16 @@ impl HandType {
 
 impl fmt::Display for HandType {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        write!(f, "{}", self.name())
+        f.write_str(self.name())
     }
 }
 
+/// Plural rank names for `HandRank::describe`, indexed by rank value (2-14)
+const RANK_PLURALS: [&str; 15] = [
+    "Unknown", "Unknown", "Twos", "Threes", "Fours", "Fives", "Sixes", "Sevens", "Eights",
+    "Nines", "Tens", "Jacks", "Queens", "Kings", "Aces",
+];
+
 /// A hand ranking that can be compared to determine winners.
 ///
 /// Comparison uses lexicographic order: hand_type -> primary_ranks -> kickers
@@ -70,31 +92,50 @@ impl HandRank {
         Self { hand_type, primary_ranks, kickers }
     }
 
-    /// Generate human-readable description
+    /// Decode a packed `HandStrength` back into a hand rank
     #[must_use]
-    pub fn describe(&self) -> String {
-        let rank_name = |r: u8| -> &str {
-            match Rank::from_value(r) {
-                Some(Rank::Two) => "Twos",
-                Some(Rank::Three) => "Threes",
-                Some(Rank::Four) => "Fours",
-                Some(Rank::Five) => "Fives",
-                Some(Rank::Six) => "Sixes",
-                Some(Rank::Seven) => "Sevens",
-                Some(Rank::Eight) => "Eights",
-                Some(Rank::Nine) => "Nines",
-                Some(Rank::Ten) => "Tens",
-                Some(Rank::Jack) => "Jacks",
-                Some(Rank::Queen) => "Queens",
-                Some(Rank::King) => "Kings",
-                Some(Rank::Ace) => "Aces",
-                None => "Unknown",
-            }
+    pub fn from_strength(strength: HandStrength) -> Self {
+        let hand_type = HandType::ALL[(strength >> 20) as usize];
+        let (num_primary, num_kickers) = match hand_type {
+            HandType::RoyalFlush | HandType::StraightFlush | HandType::Straight => (1, 0),
+            HandType::FourOfAKind => (1, 1),
+            HandType::FullHouse => (2, 0),
+            HandType::Flush | HandType::HighCard => (5, 0),
+            HandType::ThreeOfAKind => (1, 2),
+            HandType::TwoPair => (2, 1),
+            HandType::OnePair => (1, 3),
         };
+        #[allow(clippy::cast_possible_truncation)]
+        let nibble = |i: usize| ((strength >> (16 - 4 * i)) & 0xF) as u8;
+        Self {
+            hand_type,
+            primary_ranks: (0..num_primary).map(nibble).collect(),
+            kickers: (num_primary..num_primary + num_kickers).map(nibble).collect(),
+        }
+    }
 
-        let rank_single = |r: u8| -> String {
-            Rank::from_value(r).map_or("?".to_string(), |rank| rank.to_char().to_string())
-        };
+    /// Pack this hand rank into a `HandStrength` (inverse of `from_strength`)
+    ///
+    /// For hand ranks produced by the evaluator, strengths order exactly like
+    /// the hand ranks, so comparing them is a single integer compare. Other
+    /// field values (ranks outside 2-14, more than five ranks, or the same
+    /// ranks split differently between primary and kickers) may pack to the
+    /// same strength.
+    #[must_use]
+    pub fn strength(&self) -> HandStrength {
+        let mut ranks = self.primary_ranks.iter().chain(&self.kickers).copied();
+        let mut strength = self.hand_type as u32;
+        for _ in 0..5 {
+            strength = (strength << 4) | u32::from(ranks.next().unwrap_or(0));
+        }
+        strength
+    }
+
+    /// Generate human-readable description
+    #[must_use]
+    pub fn describe(&self) -> String {
+        let rank_name = |r: u8| RANK_PLURALS.get(usize::from(r)).copied().unwrap_or("Unknown");
+        let rank_single = |r: u8| Rank::from_value(r).map_or('?', Rank::to_char);
 
         match self.hand_type {
             HandType::RoyalFlush => "Royal Flush".to_string(),
@@ -145,20 +186,13 @@ impl PartialOrd for HandRank {
 
 impl Ord for HandRank {
     fn cmp(&self, other: &Self) -> Ordering {
-        // Compare hand type first
-        match self.hand_type.cmp(&other.hand_type) {
-            Ordering::Equal => {}
-            ord => return ord,
-        }
-
-        // Then compare primary ranks
-        match self.primary_ranks.cmp(&other.primary_ranks) {
-            Ordering::Equal => {}
-            ord => return ord,
-        }
-
-        // Finally compare kickers
-        self.kickers.cmp(&other.kickers)
+        // Compared field by field rather than through `strength()`, so the
+        // order agrees with the derived `Eq` for any field values (the packed
+        // form only distinguishes canonical ranks)
+        self.hand_type
+            .cmp(&other.hand_type)
+            .then_with(|| self.primary_ranks.cmp(&other.primary_ranks))
+            .then_with(|| self.kickers.cmp(&other.kickers))
     }
 }
 
@@ -168,156 +202,413 @@ impl fmt::Display for HandRank {
     }
 }
 
-/// Check if all cards are the same suit
-fn is_flush(cards: &[Card; 5]) -> bool {
-    let suit = cards[0].suit;
-    cards.iter().all(|c| c.suit == suit)
-}
-
-/// Check for straight and return high card (handles A-2-3-4-5 wheel)
-fn check_straight(ranks: &[u8; 5]) -> Option<u8> {
-    // Ranks should be sorted descending
-    // Check for regular straight
-    if ranks[0] - ranks[4] == 4
-        && ranks[0] - ranks[1] == 1
-        && ranks[1] - ranks[2] == 1
-        && ranks[2] - ranks[3] == 1
-        && ranks[3] - ranks[4] == 1
-    {
-        return Some(ranks[0]);
+/// Check a 13-bit rank mask (bit 0 = deuce) for a straight and return its
+/// high card (handles A-2-3-4-5 wheel)
+const fn straight_high(rank_mask: u16) -> Option<u8> {
+    // A bit survives only where five consecutive ranks start
+    let runs = rank_mask
+        & (rank_mask >> 1)
+        & (rank_mask >> 2)
+        & (rank_mask >> 3)
+        & (rank_mask >> 4);
+    if runs != 0 {
+        // Highest run start (bit index) + 4 ranks above it + 2 for the deuce
+        return Some((15 - runs.leading_zeros()) as u8 + 6);
     }
 
-    // Check for wheel (A-2-3-4-5) - Ace is 14, 5 is 5
-    // Sorted descending: [14, 5, 4, 3, 2]
-    if ranks == &[14, 5, 4, 3, 2] {
-        return Some(5); // Wheel's high card is 5
+    // Wheel: A, 5, 4, 3, 2
+    const WHEEL: u16 = 0b1_0000_0000_1111;
+    if rank_mask & WHEEL == WHEEL {
+        return Some(5);
     }
 
     None
 }
 
 /// Evaluate exactly 5 cards
+///
+/// Looks the hand up in the packed-strength tables (see
+/// `evaluate_five_strength`) and decodes the result.
+///
+/// # Panics
+/// The cards must be distinct. Repeated cards panic in debug builds and may
+/// panic or return an unspecified rank in release builds; use
+/// `evaluate_hand` to have them rejected with an error instead.
 #[must_use]
 pub fn evaluate_five(cards: &[Card; 5]) -> HandRank {
-    // Sort ranks descending
-    let mut ranks: [u8; 5] = cards.map(|c| c.rank.value());
-    ranks.sort_unstable_by(|a, b| b.cmp(a));
-
-    let flush = is_flush(cards);
-    let straight_high = check_straight(&ranks);
-
-    // Straight flush / Royal flush
-    if flush && straight_high.is_some() {
-        let high = straight_high.unwrap();
-        if high == 14 {
-            return HandRank::new(HandType::RoyalFlush, vec![14], vec![]);
+    HandRank::from_strength(evaluate_five_strength(cards))
+}
+
+/// Evaluate 5-7 cards and return the best 5-card hand
+///
+/// # Errors
+/// Returns an error if the number of cards is not 5-7 or a card repeats.
+pub fn evaluate_hand(cards: &[Card]) -> HoldemResult<HandRank> {
+    evaluate_hand_strength(cards).map(HandRank::from_strength)
+}
+
+/// Evaluate 5-7 cards to the packed `HandStrength` of the best 5-card hand
+///
+/// Same result as `evaluate_hand` without building a `HandRank`: 5 and 7
+/// cards are a single table lookup, 6 cards the best of their 5-card subsets.
+///
+/// # Errors
+/// Returns an error if the number of cards is not 5-7 or a card repeats.
+pub fn evaluate_hand_strength(cards: &[Card]) -> HoldemResult<HandStrength> {
+    let n = cards.len();
+    if !(5..=7).contains(&n) {
+        return Err(HoldemError::InvalidCardCount {
+            expected: "5-7",
+            got: n,
+        });
+    }
+    check_distinct(cards)?;
+
+    Ok(match n {
+        5 => evaluate_five_strength(cards.try_into().unwrap()),
+        6 => SIX_CHOOSE_FIVE
+            .iter()
+            .map(|sub| evaluate_five_strength(&sub.map(|i| cards[i])))
+            .max()
+            .unwrap(),
+        _ => evaluate_seven_strength(cards.try_into().unwrap()),
+    })
+}
+
+/// Reject hands that contain the same card twice
+///
+/// The lookup tables only cover rank multisets that real (distinct) cards
+/// can form, so repeated cards must not reach them.
+fn check_distinct(cards: &[Card]) -> HoldemResult<()> {
+    let mut mask = 0u64;
+    for card in cards {
+        if mask & card.bit() != 0 {
+            return Err(HoldemError::DuplicateCard(card.to_string()));
         }
-        return HandRank::new(HandType::StraightFlush, vec![high], vec![]);
+        mask |= card.bit();
     }
+    Ok(())
+}
 
-    // Count rank frequencies
-    let mut freq: HashMap<u8, usize> = HashMap::new();
-    for &r in &ranks {
-        *freq.entry(r).or_insert(0) += 1;
+/// Packed hand strength for fast comparisons.
+///
+/// Layout: `hand_type << 20`, followed by the hand's primary ranks and then its
+/// kickers as 4-bit rank values, most significant first (the order in which
+/// `HandRank` compares them). Higher is better and equal strengths tie.
+pub type HandStrength = u32;
+
+/// Prime per rank (index = rank - 2); a multiset of ranks has a unique product
+const RANK_PRIMES: [u32; 13] = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41];
+
+/// Indices of every five-card subset of `N` cards (`M` = N choose 5)
+const fn five_card_subsets<const N: usize, const M: usize>() -> [[usize; 5]; M] {
+    let mut table = [[0; 5]; M];
+    let mut n = 0;
+    let mut mask = 0u32;
+    while mask < 1 << N {
+        if mask.count_ones() == 5 {
+            let mut k = 0;
+            let mut c = 0;
+            while c < N {
+                if mask >> c & 1 == 1 {
+                    table[n][k] = c;
+                    k += 1;
+                }
+                c += 1;
+            }
+            n += 1;
+        }
+        mask += 1;
     }
+    assert!(n == M, "M must be N choose 5");
+    table
+}
 
-    // Sort by (count desc, rank desc)
-    let mut freq_vec: Vec<(u8, usize)> = freq.into_iter().collect();
-    freq_vec.sort_by(|a, b| match b.1.cmp(&a.1) {
-        Ordering::Equal => b.0.cmp(&a.0),
-        ord => ord,
-    });
+/// Indices of the 6 five-card subsets of 6 cards
+const SIX_CHOOSE_FIVE: [[usize; 5]; 6] = five_card_subsets::<6, 6>();
 
-    let counts: Vec<usize> = freq_vec.iter().map(|(_, c)| *c).collect();
-    let rank_values: Vec<u8> = freq_vec.iter().map(|(r, _)| *r).collect();
+/// Indices of the 21 five-card subsets of 7 cards
+const SEVEN_CHOOSE_FIVE: [[usize; 5]; 21] = five_card_subsets::<7, 21>();
 
-    // Four of a kind: [4, 1]
-    if counts == [4, 1] {
-        return HandRank::new(
-            HandType::FourOfAKind,
-            vec![rank_values[0]],
-            vec![rank_values[1]],
-        );
+/// Pack a hand type and its ordered ranks into a `HandStrength`
+fn pack_strength(hand_type: HandType, ranks: &[u8]) -> HandStrength {
+    let mut strength = hand_type as u32;
+    for i in 0..5 {
+        strength = (strength << 4) | u32::from(ranks.get(i).copied().unwrap_or(0));
     }
+    strength
+}
 
-    // Full house: [3, 2]
-    if counts == [3, 2] {
-        return HandRank::new(
-            HandType::FullHouse,
-            vec![rank_values[0], rank_values[1]],
-            vec![],
-        );
+/// Strength of five ranks (values 2-14, in any order)
+///
+/// Reference kernel used to build the lookup tables; it follows the same
+/// rules as `evaluate_five` without allocating or sorting.
+fn five_rank_strength(ranks: [u8; 5], flush: bool) -> HandStrength {
+    // Bincount the ranks, then list the distinct ones by (count, rank)
+    // descending; the two largest counts decide the hand type.
+    let mut counts = [0u8; 15];
+    let mut rank_mask = 0u16;
+    for r in ranks {
+        counts[usize::from(r)] += 1;
+        rank_mask |= 1 << (r - 2);
+    }
+    let mut ordered = [0u8; 5];
+    let mut top_counts = [0u8; 2];
+    let mut n = 0;
+    for count in (1..=4).rev() {
+        for r in (2..=14).rev() {
+            if counts[usize::from(r)] == count {
+                if n < 2 {
+                    top_counts[n] = count;
+                }
+                ordered[n] = r;
+                n += 1;
+            }
+        }
     }
 
-    // Flush
+    let straight_high = straight_high(rank_mask);
     if flush {
-        return HandRank::new(HandType::Flush, ranks.to_vec(), vec![]);
+        return match straight_high {
+            Some(14) => pack_strength(HandType::RoyalFlush, &[14]),
+            Some(high) => pack_strength(HandType::StraightFlush, &[high]),
+            None => pack_strength(HandType::Flush, &ordered),
+        };
     }
-
-    // Straight
     if let Some(high) = straight_high {
-        return HandRank::new(HandType::Straight, vec![high], vec![]);
+        return pack_strength(HandType::Straight, &[high]);
     }
 
-    // Three of a kind: [3, 1, 1]
-    if counts == [3, 1, 1] {
-        return HandRank::new(
-            HandType::ThreeOfAKind,
-            vec![rank_values[0]],
-            vec![rank_values[1], rank_values[2]],
-        );
+    let hand_type = match top_counts {
+        [4, _] => HandType::FourOfAKind,
+        [3, 2] => HandType::FullHouse,
+        [3, _] => HandType::ThreeOfAKind,
+        [2, 2] => HandType::TwoPair,
+        [2, _] => HandType::OnePair,
+        _ => HandType::HighCard,
+    };
+    pack_strength(hand_type, &ordered[..n])
+}
+
+/// Rank-count key weight per rank (index = rank - 2): `5^index`
+///
+/// Summing the weights of a hand's cards encodes its rank counts (0-4 each)
+/// as base-5 digits, a unique key below `5^13` for every rank multiset.
+const RANK_POW5: [u32; 13] = {
+    let mut table = [1; 13];
+    let mut i = 1;
+    while i < 13 {
+        table[i] = table[i - 1] * 5;
+        i += 1;
     }
+    table
+};
+
+/// Slots in the 7-card rank hash table: a power of two, under 40% full with
+/// the 49,205 rank multisets of 7 cards
+const RANK7_SLOTS: usize = 1 << 17;
 
-    // Two pair: [2, 2, 1]
-    if counts == [2, 2, 1] {
-        return HandRank::new(
-            HandType::TwoPair,
-            vec![rank_values[0], rank_values[1]],
-            vec![rank_values[2]],
-        );
+/// Home slot of a `RANK_POW5` key (Fibonacci hashing on the top 17 bits)
+#[inline]
+const fn rank7_slot(key: u32) -> usize {
+    (key.wrapping_mul(0x9E37_79B1) >> (32 - 17)) as usize
+}
+
+/// Call `visit` with every multiset of `size` rank indices (0-12, at most four
+/// of each) as a non-increasing list
+fn visit_rank_multisets(prefix: &mut Vec<usize>, size: usize, visit: &mut impl FnMut(&[usize])) {
+    if prefix.len() == size {
+        visit(prefix);
+        return;
     }
+    let top = prefix.last().copied().unwrap_or(12);
+    for i in 0..=top {
+        // A fifth copy of the same rank
+        if prefix.len() >= 4 && prefix[prefix.len() - 4] == i {
+            continue;
+        }
+        prefix.push(i);
+        visit_rank_multisets(prefix, size, visit);
+        prefix.pop();
+    }
+}
+
+/// Cactus-Kev style lookup tables, built once on first use
+struct LookupTables {
+    /// 5-card flushes, indexed by the 13-bit mask of their ranks
+    flush: Vec<HandStrength>,
+    /// Five distinct ranks without a flush (straights, high cards), by rank mask
+    unique5: Vec<HandStrength>,
+    /// Hands with repeated ranks as (prime product, strength), sorted by product
+    paired: Vec<(u32, HandStrength)>,
+    /// Best flush among 5-7 suited cards, indexed by their 13-bit rank mask
+    flush7: Vec<HandStrength>,
+    /// Best non-flush hand of 7 cards as (`RANK_POW5` key, strength), in an
+    /// open-addressed hash table of `RANK7_SLOTS` slots (key 0 = empty)
+    rank7: Vec<(u32, HandStrength)>,
+}
+
+impl LookupTables {
+    fn build() -> Self {
+        let mut flush = vec![0; 1 << 13];
+        let mut unique5 = vec![0; 1 << 13];
+        let mut paired = Vec::new();
+
+        visit_rank_multisets(&mut Vec::with_capacity(5), 5, &mut |idx| {
+            let ranks: [u8; 5] = std::array::from_fn(|k| idx[k] as u8 + 2);
+            let mask = idx.iter().fold(0usize, |m, &i| m | 1 << i);
+            if mask.count_ones() == 5 {
+                flush[mask] = five_rank_strength(ranks, true);
+                unique5[mask] = five_rank_strength(ranks, false);
+            } else {
+                let product = idx.iter().map(|&i| RANK_PRIMES[i]).product();
+                paired.push((product, five_rank_strength(ranks, false)));
+            }
+        });
+        paired.sort_unstable();
+
+        // At most one suit can hold 5+ of 7 cards, and then no full house or
+        // quads is possible, so the best flush is the hand's strength.
+        let mut flush7 = vec![0; 1 << 13];
+        for mask in 0..1usize << 13 {
+            if mask.count_ones() < 5 {
+                continue;
+            }
+            let mut sub = mask;
+            while sub != 0 {
+                if sub.count_ones() == 5 {
+                    flush7[mask] = flush7[mask].max(flush[sub]);
+                }
+                sub = (sub - 1) & mask;
+            }
+        }
 
-    // One pair: [2, 1, 1, 1]
-    if counts == [2, 1, 1, 1] {
-        return HandRank::new(
-            HandType::OnePair,
-            vec![rank_values[0]],
-            vec![rank_values[1], rank_values[2], rank_values[3]],
-        );
+        let mut rank7 = vec![(0, 0); RANK7_SLOTS];
+        visit_rank_multisets(&mut Vec::with_capacity(7), 7, &mut |idx| {
+            let key = idx.iter().map(|&i| RANK_POW5[i]).sum();
+            let best = SEVEN_CHOOSE_FIVE
+                .iter()
+                .map(|sub| five_rank_strength(sub.map(|k| idx[k] as u8 + 2), false))
+                .max()
+                .unwrap();
+            let mut slot = rank7_slot(key);
+            while rank7[slot].0 != 0 {
+                slot = (slot + 1) & (RANK7_SLOTS - 1);
+            }
+            rank7[slot] = (key, best);
+        });
+
+        Self {
+            flush,
+            unique5,
+            paired,
+            flush7,
+            rank7,
+        }
     }
+}
 
-    // High card: [1, 1, 1, 1, 1]
-    HandRank::new(HandType::HighCard, ranks.to_vec(), vec![])
+static LOOKUP_TABLES: OnceLock<LookupTables> = OnceLock::new();
+
+#[inline]
+fn lookup_tables() -> &'static LookupTables {
+    LOOKUP_TABLES.get_or_init(LookupTables::build)
 }
 
-/// Evaluate 5-7 cards and return the best 5-card hand
+/// Evaluate exactly 5 cards to a packed `HandStrength`
 ///
-/// # Errors
-/// Returns an error if the number of cards is not 5-7.
-pub fn evaluate_hand(cards: &[Card]) -> HoldemResult<HandRank> {
-    if !(5..=7).contains(&cards.len()) {
-        return Err(HoldemError::InvalidCardCount {
-            expected: "5-7",
-            got: cards.len(),
-        });
+/// Integer-only and allocation-free after the lookup tables are built.
+///
+/// # Panics
+/// The cards must be distinct. Repeated cards panic in debug builds and may
+/// panic or return an unspecified strength in release builds; use
+/// `evaluate_hand_strength` to have them rejected with an error instead.
+#[inline]
+#[must_use]
+pub fn evaluate_five_strength(cards: &[Card; 5]) -> HandStrength {
+    debug_assert!(cards_to_mask(cards).count_ones() == 5, "cards must be distinct");
+    let tables = lookup_tables();
+    let mut rank_mask = 0usize;
+    let mut product = 1u32;
+    let mut suits = 0b1111u8;
+    for card in cards {
+        let index = card.to_index();
+        let rank = usize::from(index >> 2);
+        rank_mask |= 1 << rank;
+        product *= RANK_PRIMES[rank];
+        suits &= 1 << (index & 3);
     }
 
-    if cards.len() == 5 {
-        let arr: [Card; 5] = cards.try_into().unwrap();
-        return Ok(evaluate_five(&arr));
+    if suits != 0 {
+        return tables.flush[rank_mask];
+    }
+    if rank_mask.count_ones() == 5 {
+        return tables.unique5[rank_mask];
+    }
+    let pos = tables
+        .paired
+        .binary_search_by_key(&product, |&(p, _)| p)
+        .expect("every paired rank multiset is tabulated");
+    tables.paired[pos].1
+}
+
+/// Evaluate the best 5 of 7 cards to a packed `HandStrength`
+///
+/// Looks the 7 cards up directly: a suit with 5+ cards indexes the flush
+/// table by its rank mask, otherwise the rank counts index the 7-card table.
+///
+/// # Panics
+/// The cards must be distinct. Repeated cards panic in debug builds and may
+/// panic or return an unspecified strength in release builds; use
+/// `evaluate_hand_strength` to have them rejected with an error instead.
+#[inline]
+#[must_use]
+pub fn evaluate_seven_strength(cards: &[Card; 7]) -> HandStrength {
+    debug_assert!(cards_to_mask(cards).count_ones() == 7, "cards must be distinct");
+    let tables = lookup_tables();
+    let mut suit_masks = [0usize; 4];
+    // One 4-bit card counter per suit
+    let mut suit_counts = 0u32;
+    let mut key = 0u32;
+    for card in cards {
+        let index = card.to_index();
+        let rank = usize::from(index >> 2);
+        let suit = usize::from(index & 3);
+        suit_masks[suit] |= 1 << rank;
+        suit_counts += 1 << (4 * suit);
+        key += RANK_POW5[rank];
     }
 
-    // Enumerate all C(n, 5) combinations and find the best
-    Ok(cards
-        .iter()
-        .copied()
-        .combinations(5)
-        .map(|combo| {
-            let arr: [Card; 5] = combo.try_into().unwrap();
-            evaluate_five(&arr)
-        })
-        .max()
-        .unwrap())
+    // Adding 3 sets a counter's top bit exactly when it holds 5-7 cards, so a
+    // single test decides whether there is a flush and which suit holds it
+    let flush_bits = (suit_counts + 0x3333) & 0x8888;
+    if flush_bits != 0 {
+        return tables.flush7[suit_masks[(flush_bits.trailing_zeros() / 4) as usize]];
+    }
+    let mut slot = rank7_slot(key);
+    loop {
+        let (k, strength) = tables.rank7[slot];
+        if k == key {
+            return strength;
+        }
+        assert!(k != 0, "every 7-card rank multiset is tabulated");
+        slot = (slot + 1) & (RANK7_SLOTS - 1);
+    }
+}
+
+/// Evaluate many 7-card hands at once
+///
+/// Runs across all cores when the `parallel` feature is enabled.
+#[must_use]
+pub fn evaluate_seven_batch(hands: &[[Card; 7]]) -> Vec<HandStrength> {
+    #[cfg(all(feature = "parallel", not(target_arch = "wasm32")))]
+    {
+        hands.par_iter().map(evaluate_seven_strength).collect()
+    }
+    #[cfg(not(all(feature = "parallel", not(target_arch = "wasm32"))))]
+    {
+        hands.iter().map(evaluate_seven_strength).collect()
+    }
 }
 
 /// Find the indices of players with the best hand (handles ties)
@@ -331,18 +622,44 @@ pub fn find_winners(hands: &[Vec<Card>]) -> HoldemResult<Vec<usize>> {
         return Err(HoldemError::EmptyHands);
     }
 
-    let ranks: Vec<HandRank> = hands
-        .iter()
-        .map(|h| evaluate_hand(h))
-        .collect::<Result<Vec<_>, _>>()?;
+    best_indices(hands.iter().map(|h| evaluate_hand_strength(h)))
+}
 
-    let best = ranks.iter().max().unwrap();
+/// Find the indices of the best hands among many 7-card hands
+///
+/// Batched counterpart of [`find_winners`]: strengths are computed with
+/// [`evaluate_seven_batch`] and compared as plain integers.
+///
+/// # Errors
+/// Returns an error if `hands` is empty or a hand repeats a card.
+pub fn find_winners_batch(hands: &[[Card; 7]]) -> HoldemResult<Vec<usize>> {
+    if hands.is_empty() {
+        return Err(HoldemError::EmptyHands);
+    }
+    for hand in hands {
+        check_distinct(hand)?;
+    }
 
-    Ok(ranks
-        .iter()
-        .enumerate()
-        .filter_map(|(i, r)| if r == best { Some(i) } else { None })
-        .collect())
+    best_indices(evaluate_seven_batch(hands).into_iter().map(Ok))
+}
+
+/// Indices of every maximal strength, in a single pass with a running max
+fn best_indices(
+    strengths: impl IntoIterator<Item = HoldemResult<HandStrength>>,
+) -> HoldemResult<Vec<usize>> {
+    let mut best = 0;
+    let mut winners = Vec::new();
+    for (i, strength) in strengths.into_iter().enumerate() {
+        let strength = strength?;
+        if winners.is_empty() || strength > best {
+            best = strength;
+            winners.clear();
+            winners.push(i);
+        } else if strength == best {
+            winners.push(i);
+        }
+    }
+    Ok(winners)
 }
 
 /// Compare two hands directly
@@ -351,8 +668,8 @@ pub fn find_winners(hands: &[Vec<Card>]) -> HoldemResult<Vec<usize>> {
 /// # Errors
 /// Returns an error if either hand has invalid card count.
 pub fn compare_hands(hand1: &[Card], hand2: &[Card]) -> HoldemResult<i8> {
-    let rank1 = evaluate_hand(hand1)?;
-    let rank2 = evaluate_hand(hand2)?;
+    let rank1 = evaluate_hand_strength(hand1)?;
+    let rank2 = evaluate_hand_strength(hand2)?;
 
     Ok(match rank1.cmp(&rank2) {
         Ordering::Greater => 1,
@@ -437,6 +754,15 @@ mod tests {
         assert_eq!(rank.primary_ranks, vec![5]); // Wheel high card is 5
     }
 
+    #[test]
+    fn test_straight_high_mask() {
+        assert_eq!(straight_high(0b1_1111_0000_0000), Some(14));
+        assert_eq!(straight_high(0b0_0000_0111_1101), Some(8)); // 4-8 with a stray deuce
+        assert_eq!(straight_high(0b1_0000_0000_1111), Some(5));
+        assert_eq!(straight_high(0b1_0000_0001_1111), Some(6)); // 6-high beats the wheel
+        assert_eq!(straight_high(0b1_1110_0000_0111), None);
+    }
+
     #[test]
     fn test_three_of_a_kind() {
         let hand = cards5("Ks Kh Kd 7c 2h");
@@ -480,6 +806,68 @@ mod tests {
         assert_eq!(rank.hand_type, HandType::Flush);
     }
 
+    #[test]
+    fn test_duplicate_cards_rejected() {
+        // Five aces from repeated cards is not in the paired-rank table
+        let hand = cards("Ah Ah Ah Ad Ad");
+        assert!(matches!(evaluate_hand(&hand), Err(HoldemError::DuplicateCard(_))));
+        assert!(matches!(evaluate_hand_strength(&hand), Err(HoldemError::DuplicateCard(_))));
+        assert!(matches!(
+            find_winners(&[hand, cards("Ks Kh Kd Qc Qh")]),
+            Err(HoldemError::DuplicateCard(_))
+        ));
+
+        // Same for the 7-card rank table: four aces plus a pair of aces
+        let hand = cards("Ah Ah Ah Ad Ad Kc Qs");
+        assert!(matches!(evaluate_hand(&hand), Err(HoldemError::DuplicateCard(_))));
+        let batch: [[Card; 7]; 1] = [hand.try_into().unwrap()];
+        assert!(matches!(find_winners_batch(&batch), Err(HoldemError::DuplicateCard(_))));
+    }
+
+    #[test]
+    #[cfg(debug_assertions)]
+    #[should_panic(expected = "cards must be distinct")]
+    fn test_evaluate_five_repeated_cards_debug_panic() {
+        // Would read the flush table with a 4-bit rank mask in release
+        let _ = evaluate_five(&cards5("Ah Ah Kh Qh Jh"));
+    }
+
+    #[test]
+    #[cfg(debug_assertions)]
+    #[should_panic(expected = "cards must be distinct")]
+    fn test_evaluate_seven_repeated_cards_debug_panic() {
+        let hand: [Card; 7] = cards("Ah Ah Kh Qh Jh Th 2c").try_into().unwrap();
+        let _ = evaluate_seven_strength(&hand);
+    }
+
+    #[test]
+    fn test_evaluate_six_cards() {
+        // The sixth card can improve the hand or be left out of it
+        let rank = evaluate_hand(&cards("6h 5c 4d 3s 2h Ac")).unwrap();
+        assert_eq!(rank.hand_type, HandType::Straight);
+        assert_eq!(rank.primary_ranks, vec![6]);
+        let rank = evaluate_hand(&cards("Ks Kh Kd Qc Qh 2s")).unwrap();
+        assert_eq!(rank.hand_type, HandType::FullHouse);
+        assert_eq!(rank.primary_ranks, vec![13, 12]);
+
+        for table in [&SIX_CHOOSE_FIVE[..], &SEVEN_CHOOSE_FIVE[..]] {
+            assert!(table.iter().all(|sub| sub.windows(2).all(|w| w[0] < w[1])));
+            assert!(table.windows(2).all(|w| w[0] != w[1]));
+        }
+    }
+
+    #[test]
+    fn test_describe() {
+        let describe = |s: &str| evaluate_hand(&cards(s)).unwrap().describe();
+        assert_eq!(describe("Ah Kh Qh Jh Th"), "Royal Flush");
+        assert_eq!(describe("9h 8h 7h 6h 5h"), "Straight Flush, 9 high");
+        assert_eq!(describe("Ks Kh Kd Qc Qh"), "Full House, Kings full of Queens");
+        assert_eq!(describe("Ts Th 6d 6c 2h"), "Two Pair, Tens and Sixes");
+        assert_eq!(describe("5h 4c 3d 2s Ah"), "Straight, 5 high");
+        assert_eq!(describe("Kd Jh 9c 5s 3h"), "K high");
+        assert_eq!(HandRank::new(HandType::OnePair, vec![1], vec![]).describe(), "Pair of Unknown");
+    }
+
     #[test]
     fn test_find_winners() {
         let hand1 = cards("Ah Kh Qh Jh Th"); // Royal flush
@@ -495,8 +883,31 @@ mod tests {
         let hand1 = cards("Ah Kd Qc Jh Ts"); // Broadway straight
         let hand2 = cards("Ac Ks Qh Jd Tc"); // Same broadway straight
 
-        let winners = find_winners(&[hand1, hand2]).unwrap();
+        let winners = find_winners(&[hand1.clone(), hand2.clone()]).unwrap();
         assert_eq!(winners, vec![0, 1]); // Tie
+
+        // A later, better hand replaces earlier leaders
+        let weak = cards("2h 3d 4c 5h 7s");
+        let winners = find_winners(&[weak.clone(), hand1, weak, hand2]).unwrap();
+        assert_eq!(winners, vec![1, 3]);
+    }
+
+    #[test]
+    fn test_find_winners_batch() {
+        let board = "2c 7d 9h Ts Jc";
+        let hands: Vec<Vec<Card>> = ["Qd 8s", "Qh 8c", "Ah Ad", "3s 4s"]
+            .iter()
+            .map(|hole| cards(&format!("{hole} {board}")))
+            .collect();
+        let batch: Vec<[Card; 7]> = hands
+            .iter()
+            .map(|h| h.as_slice().try_into().unwrap())
+            .collect();
+
+        let winners = find_winners_batch(&batch).unwrap();
+        assert_eq!(winners, vec![0, 1]); // Both queen-high straights split
+        assert_eq!(winners, find_winners(&hands).unwrap());
+        assert!(matches!(find_winners_batch(&[]), Err(HoldemError::EmptyHands)));
     }
 
     #[test]
@@ -541,4 +952,100 @@ mod tests {
 
         assert!(pair_with_a > pair_with_q);
     }
+
+    #[test]
+    fn test_hand_rank_ord_agrees_with_eq() {
+        let rank = |primary_ranks: Vec<u8>, kickers: Vec<u8>| HandRank {
+            hand_type: HandType::HighCard,
+            primary_ranks,
+            kickers,
+        };
+        // These pack to the same strength but are not equal
+        for (a, b) in [
+            (rank(vec![14], vec![]), rank(vec![14], vec![0])),
+            (rank(vec![14, 13], vec![]), rank(vec![14], vec![13])),
+        ] {
+            assert_eq!(a.strength(), b.strength());
+            assert_ne!(a, b);
+            assert_ne!(a.cmp(&b), Ordering::Equal);
+            assert_eq!(a.cmp(&b), b.cmp(&a).reverse());
+        }
+    }
+
+    /// Deterministic sample of distinct-card hands
+    fn sample_hands<const N: usize>(count: usize, seed: u64) -> Vec<[Card; N]> {
+        use crate::card::FULL_DECK;
+        use rand::prelude::*;
+
+        let mut rng = StdRng::seed_from_u64(seed);
+        let mut deck = FULL_DECK;
+        (0..count)
+            .map(|_| {
+                deck.shuffle(&mut rng);
+                deck[..N].try_into().unwrap()
+            })
+            .collect()
+    }
+
+    #[test]
+    fn test_five_strength_matches_hand_rank() {
+        let hands = sample_hands::<5>(3000, 7);
+        for pair in hands.windows(2) {
+            let (a, b) = (&pair[0], &pair[1]);
+            let (rank_a, rank_b) = (evaluate_five(a), evaluate_five(b));
+            let (strength_a, strength_b) = (evaluate_five_strength(a), evaluate_five_strength(b));
+            assert_eq!(strength_a >> 20, rank_a.hand_type as u32);
+            // Packed strengths order like the field-by-field comparison
+            let fields = |r: &HandRank| (r.hand_type, r.primary_ranks.clone(), r.kickers.clone());
+            assert_eq!(strength_a.cmp(&strength_b), fields(&rank_a).cmp(&fields(&rank_b)), "{a:?} vs {b:?}");
+
+            // The lookup agrees with the reference kernel, and decoding round-trips
+            let mut ranks = a.map(|c| c.rank().value());
+            ranks.sort_unstable_by(|x, y| y.cmp(x));
+            let flush = a.iter().all(|c| c.suit() == a[0].suit());
+            assert_eq!(strength_a, five_rank_strength(ranks, flush), "{a:?}");
+            assert_eq!(strength_a, five_rank_strength(a.map(|c| c.rank().value()), flush), "{a:?}");
+            let ordered: Vec<u8> = rank_a.primary_ranks.iter().chain(&rank_a.kickers).copied().collect();
+            assert_eq!(pack_strength(rank_a.hand_type, &ordered), strength_a);
+            assert_eq!(rank_a.strength(), strength_a);
+        }
+
+        // 6175 rank multisets: 1287 with distinct ranks, the rest paired
+        assert_eq!(lookup_tables().paired.len(), 4888);
+
+        for hand in ["Ah Kh Qh Jh Th", "5h 4h 3h 2h Ah", "Ks Kh Kd Kc 2h", "Ks Kh 7d 7c 2h"] {
+            let hand = cards5(hand);
+            assert_eq!(evaluate_five_strength(&hand) >> 20, evaluate_five(&hand).hand_type as u32);
+        }
+    }
+
+    #[test]
+    fn test_seven_strength_matches_evaluate_hand() {
+        let hands = sample_hands::<7>(500, 11);
+        let strengths = evaluate_seven_batch(&hands);
+        for (pair, s) in hands.windows(2).zip(strengths.windows(2)) {
+            let (rank_a, rank_b) = (evaluate_hand(&pair[0]).unwrap(), evaluate_hand(&pair[1]).unwrap());
+            assert_eq!(s[0], evaluate_seven_strength(&pair[0]));
+            assert_eq!(s[0].cmp(&s[1]), rank_a.cmp(&rank_b));
+        }
+
+        // The direct 7-card lookup agrees with the best of the 21 five-card subsets
+        let best_of_five = |hand: &[Card; 7]| {
+            SEVEN_CHOOSE_FIVE
+                .iter()
+                .map(|idx| evaluate_five_strength(&idx.map(|i| hand[i])))
+                .max()
+                .unwrap()
+        };
+        for hand in sample_hands::<7>(2000, 13) {
+            assert_eq!(evaluate_seven_strength(&hand), best_of_five(&hand), "{hand:?}");
+        }
+        for hand in ["Ah Kh Qh Jh Th 9h 8h", "9h 8h 7h 6h 5h Ah 2h", "Ah 2h 3h 4h 5c Kh Qh", "Ks Kh Kd Qc Qh Qd 2s"] {
+            let hand: [Card; 7] = cards(hand).try_into().unwrap();
+            assert_eq!(evaluate_seven_strength(&hand), best_of_five(&hand), "{hand:?}");
+        }
+
+        let rank7 = &lookup_tables().rank7;
+        assert_eq!(rank7.iter().filter(|&&(key, _)| key != 0).count(), 49_205);
+    }
 }
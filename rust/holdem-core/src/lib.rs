@@ -16,13 +16,19 @@ pub mod evaluator;
 pub mod range;
 
 // Re-export commonly used types
-pub use card::{Card, Deck, Rank, Suit};
+pub use card::{cards_to_mask, Card, Deck, Rank, Suit};
 pub use canonize::{CanonicalHand, get_all_canonical_hands};
-pub use draws::{analyze_draws, DrawAnalysis, DrawType, FlushDraw, StraightDraw};
+pub use draws::{
+    analyze_draws, analyze_draws_with_dead_mask, draw_outs_mask, DrawAnalysis, DrawType, FlushDraw,
+    StraightDraw,
+};
 pub use equity::{
     calculate_equity, calculate_equity_with_ranges, EquityRequest, EquityResult, PlayerEquity,
     PlayerHand, RangeEquityRequest, RangeEquityResult, RangePlayer, RangePlayerEquity,
 };
 pub use error::{HoldemError, HoldemResult};
-pub use evaluator::{evaluate_hand, find_winners, HandRank, HandType};
+pub use evaluator::{
+    evaluate_hand, evaluate_hand_strength, find_winners, find_winners_batch, HandRank,
+    HandStrength, HandType,
+};
 pub use range::{CardDistribution, Odometer, RangeError};
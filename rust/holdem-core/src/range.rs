@@ -3,7 +3,7 @@
 //! Implements pokerstove-style range enumeration for accurate equity calculation
 //! when players have range-based hands rather than specific cards.
 
-use crate::canonize::{get_combos_excluding, CanonicalHand, CanonizeError};
+use crate::canonize::{CanonicalHand, CanonizeError};
 use crate::card::Card;
 use std::collections::HashSet;
 
@@ -46,19 +46,24 @@ impl CardDistribution {
             return Err(RangeError::EmptyRange);
         }
 
+        let excluded_mask = excluded.iter().fold(0u64, |mask, c| mask | c.bit());
         let mut hands = Vec::new();
-        let mut weights = Vec::new();
 
         for notation in range {
             let canonical = CanonicalHand::parse(notation)
                 .map_err(|e| RangeError::InvalidHand(notation.clone(), e))?;
 
-            let combos = get_combos_excluding(&canonical, excluded);
-            for combo in combos {
-                hands.push(combo);
-                weights.push(1.0);
-            }
+            // Read the precomputed combos and their card masks directly
+            hands.extend(
+                canonical
+                    .combos()
+                    .iter()
+                    .zip(canonical.combo_masks())
+                    .filter(|&(_, &mask)| mask & excluded_mask == 0)
+                    .map(|(&combo, _)| combo),
+            );
         }
+        let weights = vec![1.0; hands.len()];
 
         if hands.is_empty() {
             return Err(RangeError::NoCombosAvailable);
@@ -100,11 +105,17 @@ impl CardDistribution {
     /// Filter out hands that conflict with the given cards
     #[must_use]
     pub fn filter_excluding(&self, excluded: &HashSet<Card>) -> Self {
+        self.filter_excluding_mask(excluded.iter().fold(0, |mask, card| mask | card.bit()))
+    }
+
+    /// Filter out hands that use any card in `excluded` (bit = `Card::to_index`)
+    #[must_use]
+    pub fn filter_excluding_mask(&self, excluded: u64) -> Self {
         let mut hands = Vec::new();
         let mut weights = Vec::new();
 
         for (i, &(c1, c2)) in self.hands.iter().enumerate() {
-            if !excluded.contains(&c1) && !excluded.contains(&c2) {
+            if (c1.bit() | c2.bit()) & excluded == 0 {
                 hands.push((c1, c2));
                 weights.push(self.weights[i]);
             }
@@ -167,26 +178,26 @@ impl Odometer {
         }
         self.extents.iter().product()
     }
-}
-
-impl Iterator for Odometer {
-    type Item = Vec<usize>;
 
-    fn next(&mut self) -> Option<Self::Item> {
+    /// Advance to the next combination and borrow its indices
+    ///
+    /// Same sequence as `Iterator::next` without cloning the indices into a
+    /// new `Vec` at every step.
+    pub fn advance(&mut self) -> Option<&[usize]> {
         if self.exhausted {
             return None;
         }
 
         if !self.started {
             self.started = true;
-            return Some(self.current.clone());
+            return Some(&self.current);
         }
 
         // Increment from the rightmost position
         for i in (0..self.extents.len()).rev() {
             self.current[i] += 1;
             if self.current[i] < self.extents[i] {
-                return Some(self.current.clone());
+                return Some(&self.current);
             }
             self.current[i] = 0;
         }
@@ -197,14 +208,23 @@ impl Iterator for Odometer {
     }
 }
 
+impl Iterator for Odometer {
+    type Item = Vec<usize>;
+
+    fn next(&mut self) -> Option<Self::Item> {
+        self.advance().map(<[usize]>::to_vec)
+    }
+}
+
 /// Check if a set of hands has any card conflicts
 #[must_use]
 pub fn hands_are_disjoint(hands: &[(Card, Card)]) -> bool {
-    let mut seen = HashSet::new();
+    let mut seen = 0u64;
     for &(c1, c2) in hands {
-        if !seen.insert(c1) || !seen.insert(c2) {
+        if c1 == c2 || seen & (c1.bit() | c2.bit()) != 0 {
             return false;
         }
+        seen |= c1.bit() | c2.bit();
     }
     true
 }
@@ -325,6 +345,7 @@ mod tests {
 
         // Conflict - Ah used twice
         assert!(!hands_are_disjoint(&[(ah, as_), (ah, kh)]));
+        assert!(!hands_are_disjoint(&[(ah, ah)]));
     }
 
     #[test]
@@ -336,5 +357,6 @@ mod tests {
         let excluded: HashSet<Card> = [ah].into_iter().collect();
         let filtered = dist.filter_excluding(&excluded);
         assert_eq!(filtered.len(), 3);
+        assert_eq!(dist.filter_excluding_mask(ah.bit()).hands(), filtered.hands());
     }
 }
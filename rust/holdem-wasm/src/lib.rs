@@ -383,7 +383,7 @@ fn evaluate_hand_impl(card_strings: Vec<String>) -> Result<types::EvaluateOutput
 /// JsValue containing `CanonicalHandsResponse` with array of hands and total count
 #[wasm_bindgen]
 pub fn wasm_get_canonical_hands() -> Result<JsValue, JsValue> {
-    let hands: Vec<CanonicalHandOutput> = canonize::get_all_canonical_hands()
+    let hands: Vec<CanonicalHandOutput> = canonize::CanonicalHand::all()
         .iter()
         .map(CanonicalHandOutput::from)
         .collect();
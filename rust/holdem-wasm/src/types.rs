@@ -156,9 +156,9 @@ impl From<Card> for CardInfoOutput {
     fn from(card: Card) -> Self {
         Self {
             notation: card.to_string(),
-            rank: card.rank.to_char().to_string(),
-            suit: card.suit.to_char().to_string(),
-            suit_symbol: suit_symbol(card.suit),
+            rank: card.rank().to_char().to_string(),
+            suit: card.suit().to_char().to_string(),
+            suit_symbol: suit_symbol(card.suit()),
         }
     }
 }